@@ -0,0 +1,69 @@
+"""
+Process-wide transport resources shared by all API clients.
+
+Builds TLS contexts and aiohttp connectors once instead of per client session.
+"""
+
+import asyncio
+import ssl
+import weakref
+from typing import Any
+
+import aiohttp
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+# Verifying contexts loaded once from the CA bundle requests would use. urllib3
+# adjusts the context it is handed (verify_mode, ALPN, extra CA locations), so
+# aiohttp gets a context of its own instead of sharing the requests one.
+REQUESTS_SSL_CONTEXT = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+AIOHTTP_SSL_CONTEXT = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+
+_connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.TCPConnector]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class SharedTLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools share one verifying TLS context.
+
+    urllib3 otherwise builds a new context for every HTTPS connection.
+    Only mount it on sessions whose requests verify certificates: urllib3
+    sets ``verify_mode`` on the context it is given, so ``verify=False``
+    requests must go through a plain HTTPAdapter.
+    """
+
+    def init_poolmanager(self, *args: Any, **pool_kwargs: Any) -> None:
+        """Create the pool manager with the shared TLS context."""
+        pool_kwargs.setdefault("ssl_context", REQUESTS_SSL_CONTEXT)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        """Create proxy managers with the shared TLS context."""
+        proxy_kwargs.setdefault("ssl_context", REQUESTS_SSL_CONTEXT)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Get the aiohttp connector shared by async clients on the running event loop.
+
+    Returns:
+        Pooled TCPConnector with DNS caching
+    """
+    loop = asyncio.get_running_loop()
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=0, limit_per_host=100, ttl_dns_cache=300, keepalive_timeout=75
+        )
+        _connectors[loop] = connector
+    return connector
+
+
+async def close_shared_connector() -> None:
+    """Close the shared connector of the running event loop, if any."""
+    connector = _connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
@@ -0,0 +1,288 @@
+"""
+Async API client built on aiohttp for concurrent request execution.
+
+Mirrors the BaseClient interface with awaitable HTTP methods sharing a single connection pool.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar, Union
+
+import aiohttp
+import orjson
+from tenacity import AsyncRetrying
+
+from clients._transport import AIOHTTP_SSL_CONTEXT, get_shared_connector
+from clients.base_client import APIResponse, ClientCore, retry_policy
+from config.settings import settings
+from utils.logger import logger
+from utils.response_cache import response_cache
+
+T = TypeVar("T")
+
+
+class _BufferedResponse:
+    """Fully-read aiohttp response exposing the attributes APIResponse relies on."""
+
+    def __init__(
+        self, status_code: int, headers: Any, content: bytes, encoding: Optional[str] = None
+    ):
+        """
+        Initialize buffered response.
+
+        Args:
+            status_code: HTTP status code
+            headers: Response headers (case-insensitive mapping)
+            content: Raw response body
+            encoding: Body charset, defaults to UTF-8
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        """Get response body decoded as text."""
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        """Decode response body as JSON."""
+        return orjson.loads(self.content)
+
+
+class AsyncBaseClient(ClientCore):
+    """
+    Async HTTP client for API testing.
+
+    Features:
+    - aiohttp session on a pooled, keep-alive TCP connector shared per event loop
+    - Awaitable get/post/put/patch/delete with the same signatures as BaseClient
+    - Retry with randomized exponential backoff, same policy as BaseClient
+    - Request/response logging and response time tracking
+
+    Note:
+        Instances must be created inside a running event loop, since the
+        underlying aiohttp session binds to it on construction.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        verify_ssl: bool = True,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """
+        Initialize the async API client.
+
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            session: Shared session to reuse; the client creates and owns one if omitted
+        """
+        super().__init__(base_url, timeout, verify_ssl)
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create aiohttp session on the event loop's shared connector.
+
+        Returns:
+            Configured aiohttp.ClientSession
+        """
+        return aiohttp.ClientSession(connector=get_shared_connector(), connector_owner=False)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, Dict[str, Any]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs: Any,
+    ) -> APIResponse:
+        """
+        Make HTTP request with retry, logging and error handling.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint
+            params: URL parameters
+            json_data: JSON request body
+            data: Form data or raw body
+            headers: Request headers
+            timeout: Request timeout
+            **kwargs: Additional aiohttp request arguments
+
+        Returns:
+            APIResponse object
+        """
+        url = self._build_url(endpoint)
+        prepared_headers = self._prepare_headers(headers, json_body=json_data is not None)
+        timeout = timeout or self.timeout
+        self._invalidate_cached(method, endpoint)
+
+        retrying = AsyncRetrying(
+            **retry_policy((aiohttp.ClientConnectionError, asyncio.TimeoutError))
+        )
+        return await retrying(
+            self._send, method, url, params, json_data, data, prepared_headers, timeout, **kwargs
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        data: Optional[Union[str, Dict[str, Any]]],
+        prepared_headers: Dict[str, str],
+        timeout: int,
+        **kwargs: Any,
+    ) -> APIResponse:
+        """
+        Send a single request attempt.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: URL parameters
+            json_data: JSON request body
+            data: Form data or raw body
+            prepared_headers: Merged request headers
+            timeout: Request timeout
+            **kwargs: Additional aiohttp request arguments
+
+        Returns:
+            APIResponse object
+        """
+        # Log request
+        if settings.enable_logging and logger.isEnabledFor(logging.INFO):
+            logger.log_request(method, url, prepared_headers, json_data or data)
+
+        # Make request and track time
+        start_time = time.perf_counter()
+        try:
+            async with self.session.request(
+                method,
+                url,
+                params=params,
+                data=orjson.dumps(json_data) if json_data is not None else data,
+                headers=prepared_headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                ssl=AIOHTTP_SSL_CONTEXT if self.verify_ssl else False,
+                **kwargs,
+            ) as resp:
+                content = await resp.read()
+                response = _BufferedResponse(resp.status, resp.headers, content, resp.charset)
+            elapsed = time.perf_counter() - start_time
+
+            api_response = APIResponse(response, elapsed)
+
+            # Log response (the body is only parsed when it will be logged)
+            if settings.enable_logging and logger.isEnabledFor(logging.INFO):
+                logger.log_response(
+                    response.status_code,
+                    elapsed,
+                    response.headers,
+                    api_response.json if content and logger.isEnabledFor(logging.DEBUG) else None,
+                )
+
+            return api_response
+
+        except asyncio.TimeoutError:
+            elapsed = time.perf_counter() - start_time
+            logger.error(f"Request timeout after {elapsed:.2f}s: {method} {url}")
+            raise
+        except aiohttp.ClientError as e:
+            elapsed = time.perf_counter() - start_time
+            logger.error(f"Request failed after {elapsed:.2f}s: {method} {url} - {str(e)}")
+            raise
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cacheable: bool = False,
+        **kwargs: Any,
+    ) -> APIResponse:
+        """Make GET request, optionally served from the response cache."""
+        if not (cacheable and settings.enable_response_cache) or kwargs:
+            return await self.request("GET", endpoint, params=params, **kwargs)
+
+        start_time = time.perf_counter()
+        key = self._cache_key(endpoint, params)
+        cached: Optional[APIResponse] = response_cache.get(key)
+        if cached is not None:
+            return cached.cached_copy(time.perf_counter() - start_time)
+
+        response = await self.request("GET", endpoint, params=params)
+        if response.is_success() and "no-store" not in response.headers.get("Cache-Control", ""):
+            response_cache.set(key, response)
+        return response
+
+    async def post(
+        self,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> APIResponse:
+        """Make POST request."""
+        return await self.request("POST", endpoint, json_data=json_data, data=data, **kwargs)
+
+    async def put(
+        self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> APIResponse:
+        """Make PUT request."""
+        return await self.request("PUT", endpoint, json_data=json_data, **kwargs)
+
+    async def patch(
+        self, endpoint: str, json_data: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> APIResponse:
+        """Make PATCH request."""
+        return await self.request("PATCH", endpoint, json_data=json_data, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> APIResponse:
+        """Make DELETE request."""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session if this client owns it."""
+        if self._owns_session:
+            await self.session.close()
+            logger.debug("Async API client session closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
+async def gather_with_concurrency(n: int, *coros: Awaitable[T]) -> List[T]:
+    """
+    Run awaitables concurrently with at most ``n`` in flight.
+
+    Args:
+        n: Maximum number of concurrent awaitables
+        *coros: Awaitables to run
+
+    Returns:
+        Results in the same order as the given awaitables
+    """
+    semaphore = asyncio.Semaphore(n)
+
+    async def _bounded(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_bounded(coro) for coro in coros))
@@ -0,0 +1,97 @@
+"""
+Async API clients for ReqRes.in endpoints.
+
+Share the endpoint methods of the sync clients on top of AsyncBaseClient,
+so every endpoint method returns an awaitable APIResponse.
+"""
+
+from typing import Any, Awaitable, List, Mapping, Optional, Sequence
+
+from clients.async_base_client import AsyncBaseClient, gather_with_concurrency
+from clients.auth_client import AuthEndpoints
+from clients.base_client import APIResponse
+from clients.resources_client import ResourcesEndpoints
+from clients.users_client import UsersEndpoints
+from config.settings import settings
+
+
+class AsyncAuthClient(AsyncBaseClient, AuthEndpoints[Awaitable[APIResponse]]):
+    """Async client for Authentication API endpoints."""
+
+
+class AsyncUsersClient(AsyncBaseClient, UsersEndpoints[Awaitable[APIResponse]]):
+    """Async client for Users API endpoints."""
+
+    async def get_users_bulk(
+        self, user_ids: Sequence[int], max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Get several users concurrently on the event loop.
+
+        Args:
+            user_ids: User IDs, each passed to get_user
+            max_workers: Maximum requests in flight (defaults to parallel_workers)
+
+        Returns:
+            List of APIResponse in the same order as user_ids
+        """
+        return await gather_with_concurrency(
+            max_workers or settings.parallel_workers,
+            *(self.get_user(user_id) for user_id in user_ids),
+        )
+
+    async def get_users_pages(
+        self, pages: Sequence[int], max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Get several pages of the users list concurrently on the event loop.
+
+        Args:
+            pages: Page numbers, each passed to get_users
+            max_workers: Maximum requests in flight (defaults to parallel_workers)
+
+        Returns:
+            List of APIResponse in the same order as pages
+        """
+        return await gather_with_concurrency(
+            max_workers or settings.parallel_workers, *(self.get_users(page=page) for page in pages)
+        )
+
+    async def create_users_bulk(
+        self, users: Sequence[Mapping[str, Any]], max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Create several users concurrently on the event loop.
+
+        Args:
+            users: User payloads, each passed to create_user
+            max_workers: Maximum requests in flight (defaults to parallel_workers)
+
+        Returns:
+            List of APIResponse in the same order as users
+        """
+        return await gather_with_concurrency(
+            max_workers or settings.parallel_workers, *(self.create_user(**user) for user in users)
+        )
+
+
+class AsyncResourcesClient(AsyncBaseClient, ResourcesEndpoints[Awaitable[APIResponse]]):
+    """Async client for Resources API endpoints."""
+
+    async def get_resources_bulk(
+        self, resource_ids: Sequence[int], max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Get several resources concurrently on the event loop.
+
+        Args:
+            resource_ids: Resource IDs, each passed to get_resource
+            max_workers: Maximum requests in flight (defaults to parallel_workers)
+
+        Returns:
+            List of APIResponse in the same order as resource_ids
+        """
+        return await gather_with_concurrency(
+            max_workers or settings.parallel_workers,
+            *(self.get_resource(resource_id) for resource_id in resource_ids),
+        )
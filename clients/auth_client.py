@@ -5,22 +5,18 @@ Provides methods for authentication operations.
 """
 from typing import Any, Optional
 
-from clients.base_client import APIResponse, BaseClient
+from clients.base_client import APIResponse, BaseClient, EndpointsMixin, ResponseT
 
 
-class AuthClient(BaseClient):
-    """Client for Authentication API endpoints."""
-    
-    def __init__(self, **kwargs: Any):
-        """Initialize Auth client."""
-        super().__init__(**kwargs)
+class AuthEndpoints(EndpointsMixin[ResponseT]):
+    """Authentication API endpoint methods, shared by the sync and async clients."""
     
     def register(
         self,
         email: str,
         password: str,
         **additional_fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Register a new user.
         
@@ -34,16 +30,17 @@ class AuthClient(BaseClient):
         """
         data = {
             "email": email,
-            "password": password,
-            **additional_fields
+            "password": password
         }
+        if additional_fields:
+            data.update(additional_fields)
         return self.post("register", json_data=data)
     
     def register_unsuccessful(
         self,
         email: Optional[str] = None,
         password: Optional[str] = None
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Attempt registration with incomplete data (for negative testing).
         
@@ -67,7 +64,7 @@ class AuthClient(BaseClient):
         email: str,
         password: str,
         **additional_fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Login user and get token.
         
@@ -81,16 +78,17 @@ class AuthClient(BaseClient):
         """
         data = {
             "email": email,
-            "password": password,
-            **additional_fields
+            "password": password
         }
+        if additional_fields:
+            data.update(additional_fields)
         return self.post("login", json_data=data)
     
     def login_unsuccessful(
         self,
         email: Optional[str] = None,
         password: Optional[str] = None
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Attempt login with invalid credentials (for negative testing).
         
@@ -109,7 +107,7 @@ class AuthClient(BaseClient):
         
         return self.post("login", json_data=data)
     
-    def logout(self, token: Optional[str] = None) -> APIResponse:
+    def logout(self, token: Optional[str] = None) -> ResponseT:
         """
         Logout user (if endpoint exists).
         
@@ -128,3 +126,7 @@ class AuthClient(BaseClient):
             headers["Authorization"] = f"Bearer {token}"
         
         return self.post("logout", headers=headers)
+
+
+class AuthClient(BaseClient, AuthEndpoints[APIResponse]):
+    """Client for Authentication API endpoints."""
@@ -3,57 +3,244 @@ Base API client with common HTTP operations and enterprise features.
 
 Provides request/response handling, retry logic, logging, and response validation.
 """
+import logging
 import time
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from tenacity import (
-    retry,
+    Retrying,
     retry_if_exception_type,
+    retry_if_result,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
-from urllib3.util.retry import Retry as URLRetry
 
-from config.settings import settings
+from clients._transport import SharedTLSAdapter
+from config.settings import join_url, settings
 from utils.logger import logger
+from utils.response_cache import CacheKey, response_cache
+
+T = TypeVar("T")
+R = TypeVar("R")
+ResponseT = TypeVar("ResponseT")
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - pysimdjson is optional
+    simdjson = None  # type: ignore[assignment]
+
+# Status codes worth retrying: throttling and transient gateway errors
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Methods that evict cached GET responses of the collection they modify
+CACHE_INVALIDATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def retry_policy(
+    exception_types: Tuple[Type[BaseException], ...] = (requests.ConnectionError, requests.Timeout)
+) -> Dict[str, Any]:
+    """
+    Build tenacity keyword arguments for retrying API requests.
+    
+    Transport errors and RETRY_STATUS_CODES responses are retried with
+    randomized exponential backoff; 2xx/4xx responses return immediately.
+    Once attempts run out the last response is returned (or its exception re-raised).
+    
+    Args:
+        exception_types: Transport exceptions that trigger a retry
+    
+    Returns:
+        Keyword arguments for tenacity.Retrying / AsyncRetrying
+    """
+    return {
+        "stop": stop_after_attempt(settings.api_retry_count + 1),
+        "wait": (
+            wait_exponential(multiplier=settings.api_retry_delay, max=10)
+            + wait_random(0, settings.api_retry_delay)
+        ),
+        "retry": (
+            retry_if_exception_type(exception_types)
+            | retry_if_result(lambda response: response.status_code in RETRY_STATUS_CODES)
+        ),
+        "retry_error_callback": lambda retry_state: retry_state.outcome.result(),
+        "reraise": True,
+    }
+
+
+class RawResponse(Protocol):
+    """Fully-read HTTP response as wrapped by APIResponse (e.g. requests.Response)."""
+    
+    @property
+    def status_code(self) -> int: ...
+    
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+    
+    @property
+    def content(self) -> bytes: ...
+    
+    @property
+    def text(self) -> str: ...
 
 
 class APIResponse:
-    """Wrapper for API response with convenient accessors."""
+    """
+    Wrapper for API response with convenient accessors.
+    
+    Uses __slots__ to keep per-response memory low; subclasses adding
+    attributes must declare their own __slots__.
+    """
+    
+    __slots__ = (
+        "response",
+        "status_code",
+        "elapsed_time",
+        "_json_data",
+        "_json_doc",
+        "_text",
+        "from_cache",
+    )
     
-    def __init__(self, response: requests.Response, elapsed_time: float):
+    def __init__(self, response: RawResponse, elapsed_time: float):
         """
         Initialize API response wrapper.
         
         Args:
-            response: requests.Response object
-            elapsed_time: Response time in seconds
+            response: requests.Response or another fully-read response
+            elapsed_time: Response time in seconds, measured with time.perf_counter()
         """
         self.response = response
         self.status_code = response.status_code
-        self.headers = dict(response.headers)
         self.elapsed_time = elapsed_time
         self._json_data: Optional[Dict[str, Any]] = None
-        self.text = response.text
+        self._json_doc: Any = None
+        self._text: Optional[str] = None
+        self.from_cache = False
+    
+    def cached_copy(self, elapsed_time: float) -> "APIResponse":
+        """
+        Copy this response for a cache hit.
+        
+        The copy parses its own JSON body on first access, so a caller
+        mutating ``json`` never changes what later hits return.
+        
+        Args:
+            elapsed_time: Time taken to serve the hit, in seconds
+            
+        Returns:
+            APIResponse marked as served from the response cache
+        """
+        copy = APIResponse(self.response, elapsed_time)
+        copy._json_doc = self._json_doc
+        copy._text = self._text
+        copy.from_cache = True
+        return copy
+    
+    @property
+    def text(self) -> str:
+        """
+        Get response body as text, decoded once on first access.
+        
+        Returns:
+            Decoded response body
+        """
+        if self._text is None:
+            self._text = self.response.text
+        return self._text
+    
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """
+        Get response headers without copying them.
+        
+        Returns:
+            Case-insensitive mapping of response headers
+        """
+        return self.response.headers
     
     @property
     def json(self) -> Dict[str, Any]:
         """
-        Get JSON response body.
+        Get JSON response body, parsed once on first access.
         
         Returns:
             JSON response as dictionary
         """
         if self._json_data is None:
             try:
-                self._json_data = self.response.json()
-            except requests.exceptions.JSONDecodeError:
+                self._json_data = orjson.loads(self.response.content)
+            except orjson.JSONDecodeError:
                 logger.error(f"Failed to decode JSON response: {self.text[:200]}")
                 self._json_data = {}
         return self._json_data
     
+    def jq(self, pointer: str) -> Any:
+        """
+        Get a single value from the JSON body by JSON Pointer (RFC 6901).
+        
+        Uses simdjson when available so probing a few fields of a large list
+        response does not materialize the whole body; otherwise (or once the
+        body is already parsed) the pointer is resolved against ``json``.
+        
+        Args:
+            pointer: JSON Pointer, e.g. "/data/0/id"
+            
+        Returns:
+            Value at the pointer as plain Python objects
+            
+        Raises:
+            KeyError: If an object member does not exist
+            IndexError: If an array index is out of range
+        """
+        if self._json_data is None and simdjson is not None:
+            if self._json_doc is None:
+                try:
+                    doc = simdjson.Parser().parse(self.response.content)
+                except ValueError:
+                    doc = None
+                # Scalar documents have no members to point at
+                is_container = isinstance(doc, (simdjson.Object, simdjson.Array))
+                self._json_doc = doc if is_container else False
+            if isinstance(self._json_doc, (simdjson.Object, simdjson.Array)):
+                found = self._json_doc.at_pointer(pointer)
+                if isinstance(found, simdjson.Object):
+                    return found.as_dict()
+                if isinstance(found, simdjson.Array):
+                    return found.as_list()
+                return found
+        
+        value = self.json
+        for token in pointer.split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(value, list):
+                try:
+                    value = value[int(token)]
+                except ValueError:
+                    raise IndexError(f"Invalid array index in JSON pointer: {pointer}")
+            else:
+                value = value[token]
+        return value
+    
     def is_success(self) -> bool:
         """Check if response status is 2xx."""
         return 200 <= self.status_code < 300
@@ -70,16 +257,12 @@ class APIResponse:
         return f"<APIResponse [{self.status_code}] {self.elapsed_time:.3f}s>"
 
 
-class BaseClient:
+class ClientCore:
     """
-    Base HTTP client for API testing with enterprise features.
+    Transport-independent parts shared by the sync and async API clients.
     
-    Features:
-    - Automatic retry with exponential backoff
-    - Request/response logging
-    - Session management
-    - Response time tracking
-    - Error handling
+    Holds connection settings and default headers, and builds request URLs
+    and headers; subclasses provide the session and HTTP methods.
     """
     
     def __init__(
@@ -89,7 +272,7 @@ class BaseClient:
         verify_ssl: bool = True
     ):
         """
-        Initialize the API client.
+        Initialize client settings.
         
         Args:
             base_url: Base URL for API
@@ -99,35 +282,11 @@ class BaseClient:
         self.base_url = base_url or settings.api_base_url
         self.timeout = timeout or settings.api_timeout
         self.verify_ssl = verify_ssl
-        self.session = self._create_session()
-        self._default_headers = {
-            "Content-Type": "application/json",
+        # Never mutated in place: requests in flight may still hold the old dict
+        self._default_headers: Dict[str, str] = {
             "Accept": "application/json"
         }
     
-    def _create_session(self) -> requests.Session:
-        """
-        Create and configure requests session with retry strategy.
-        
-        Returns:
-            Configured requests.Session
-        """
-        session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = URLRetry(
-            total=settings.api_retry_count,
-            backoff_factor=settings.api_retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "PATCH", "DELETE"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
-    
     def _build_url(self, endpoint: str) -> str:
         """
         Build full URL from base and endpoint.
@@ -138,27 +297,173 @@ class BaseClient:
         Returns:
             Full URL
         """
-        base = self.base_url.rstrip("/")
-        endpoint = endpoint.lstrip("/")
-        return f"{base}/{endpoint}"
+        return join_url(self.base_url, endpoint)
     
     def _prepare_headers(
         self,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        json_body: bool = False
     ) -> Dict[str, str]:
         """
         Prepare request headers.
         
+        Without per-call headers or a JSON body the shared default headers are
+        returned as-is, so callers must treat the result as read-only. Setting
+        or clearing the auth token replaces the defaults instead of mutating
+        them, so requests already in flight keep the headers they started with.
+        
         Args:
             headers: Additional headers
+            json_body: Whether the request carries a JSON body
             
         Returns:
             Merged headers dictionary
         """
-        prepared_headers = self._default_headers.copy()
-        if headers:
-            prepared_headers.update(headers)
-        return prepared_headers
+        if json_body:
+            return {**self._default_headers, "Content-Type": "application/json", **(headers or {})}
+        if not headers:
+            return self._default_headers
+        return {**self._default_headers, **headers}
+    
+    def _invalidate_cached(self, method: str, endpoint: str) -> None:
+        """
+        Evict cached GETs of the collection a mutating request touches.
+        
+        A POST to ``users`` or a DELETE to ``unknown/2`` evicts every cached
+        response of that collection.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+        """
+        if method.upper() in CACHE_INVALIDATING_METHODS and settings.enable_response_cache:
+            collection = endpoint.lstrip("/").split("/", 1)[0]
+            response_cache.invalidate(self._build_url(collection))
+    
+    def _cache_key(self, endpoint: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+        """
+        Build the response cache key for a GET sent with the default headers.
+        
+        Args:
+            endpoint: API endpoint
+            params: URL parameters
+            
+        Returns:
+            Cache key covering URL, parameters and default headers (e.g. Authorization)
+        """
+        return response_cache.make_key(self._build_url(endpoint), params, self._default_headers)
+    
+    def clear_cache(self, endpoint: str = "") -> None:
+        """
+        Evict cached responses for an endpoint, or for the whole API by default.
+        
+        Args:
+            endpoint: API endpoint whose cached responses (and sub-paths) are evicted
+        """
+        response_cache.invalidate(self._build_url(endpoint))
+    
+    def set_auth_token(self, token: str) -> None:
+        """
+        Set authentication token in default headers.
+        
+        Args:
+            token: Bearer token
+        """
+        self._default_headers = {**self._default_headers, "Authorization": f"Bearer {token}"}
+        logger.info("Authentication token set")
+    
+    def clear_auth_token(self) -> None:
+        """Remove authentication token from headers."""
+        if "Authorization" in self._default_headers:
+            self._default_headers = {
+                key: value for key, value in self._default_headers.items() if key != "Authorization"
+            }
+            logger.info("Authentication token cleared")
+
+
+class BaseClient(ClientCore):
+    """
+    Base HTTP client for API testing with enterprise features.
+    
+    Features:
+    - Automatic retry with exponential backoff
+    - Request/response logging
+    - Session management
+    - Response time tracking
+    - Error handling
+    """
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        verify_ssl: bool = True,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize the API client.
+        
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            session: Shared session to reuse; the client creates and owns one if omitted
+        """
+        super().__init__(base_url, timeout, verify_ssl)
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session()
+    
+    @staticmethod
+    def create_session(
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        verify_ssl: bool = True
+    ) -> requests.Session:
+        """
+        Create and configure requests session with a pooled adapter.
+        
+        Verifying sessions reuse the process-wide requests TLS context from clients._transport.
+        
+        The session can be shared between clients so their requests reuse
+        one connection pool. Pool sizes default to values scaled by
+        ``settings.parallel_workers`` so concurrent requests keep their
+        keep-alive connections instead of overflowing the pool.
+        
+        Args:
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum connections kept alive per host
+            verify_ssl: Whether requests sent through the session verify certificates
+            
+        Returns:
+            Configured requests.Session
+        """
+        if pool_connections is None:
+            pool_connections = max(32, settings.parallel_workers * 4)
+        if pool_maxsize is None:
+            pool_maxsize = settings.http_pool_maxsize or max(64, settings.parallel_workers * 8)
+        
+        session = requests.Session()
+        
+        # Retries are handled per request in BaseClient.request
+        adapter_cls = SharedTLSAdapter if verify_ssl else HTTPAdapter
+        adapter = adapter_cls(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=settings.http_pool_block
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        
+        return session
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the session owned by this client.
+        
+        Returns:
+            Configured requests.Session
+        """
+        return self.create_session(verify_ssl=self.verify_ssl)
     
     def request(
         self,
@@ -172,7 +477,7 @@ class BaseClient:
         **kwargs: Any
     ) -> APIResponse:
         """
-        Make HTTP request with logging and error handling.
+        Make HTTP request with retry, logging and error handling.
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
@@ -188,46 +493,89 @@ class BaseClient:
             APIResponse object
         """
         url = self._build_url(endpoint)
-        prepared_headers = self._prepare_headers(headers)
+        prepared_headers = self._prepare_headers(headers, json_body=json_data is not None)
         timeout = timeout or self.timeout
+        self._invalidate_cached(method, endpoint)
         
+        return Retrying(**retry_policy())(
+            self._send,
+            method,
+            url,
+            params,
+            json_data,
+            data,
+            prepared_headers,
+            timeout,
+            **kwargs
+        )
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        data: Optional[Union[str, Dict[str, Any]]],
+        prepared_headers: Dict[str, str],
+        timeout: int,
+        **kwargs: Any
+    ) -> APIResponse:
+        """
+        Send a single request attempt.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: URL parameters
+            json_data: JSON request body
+            data: Form data or raw body
+            prepared_headers: Merged request headers
+            timeout: Request timeout
+            **kwargs: Additional requests arguments
+            
+        Returns:
+            APIResponse object
+        """
         # Log request
-        if settings.enable_logging:
+        if settings.enable_logging and logger.isEnabledFor(logging.INFO):
             logger.log_request(method, url, prepared_headers, json_data or data)
         
         # Make request and track time
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
-                data=data,
+                data=orjson.dumps(json_data) if json_data is not None else data,
                 headers=prepared_headers,
                 timeout=timeout,
                 verify=self.verify_ssl,
                 **kwargs
             )
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
+            
+            api_response = APIResponse(response, elapsed)
             
-            # Log response
-            if settings.enable_logging:
+            # Log response (the body is only parsed when it will be logged)
+            if settings.enable_logging and logger.isEnabledFor(logging.INFO):
                 logger.log_response(
                     response.status_code,
                     elapsed,
                     response.headers,
-                    response.json() if response.text else None
+                    api_response.json
+                    if response.content and logger.isEnabledFor(logging.DEBUG)
+                    else None
                 )
             
-            return APIResponse(response, elapsed)
+            return api_response
             
         except requests.exceptions.Timeout:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error(f"Request timeout after {elapsed:.2f}s: {method} {url}")
             raise
         except requests.exceptions.RequestException as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error(f"Request failed after {elapsed:.2f}s: {method} {url} - {str(e)}")
             raise
     
@@ -235,6 +583,7 @@ class BaseClient:
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
+        cacheable: bool = False,
         **kwargs: Any
     ) -> APIResponse:
         """
@@ -243,12 +592,27 @@ class BaseClient:
         Args:
             endpoint: API endpoint
             params: URL parameters
+            cacheable: Serve from and store successful responses in the response cache
+                (responses marked Cache-Control: no-store are not stored). Hits are
+                copies marked from_cache, timed by the cache lookup
             **kwargs: Additional request arguments
             
         Returns:
             APIResponse object
         """
-        return self.request("GET", endpoint, params=params, **kwargs)
+        if not (cacheable and settings.enable_response_cache) or kwargs:
+            return self.request("GET", endpoint, params=params, **kwargs)
+        
+        start_time = time.perf_counter()
+        key = self._cache_key(endpoint, params)
+        cached: Optional[APIResponse] = response_cache.get(key)
+        if cached is not None:
+            return cached.cached_copy(time.perf_counter() - start_time)
+        
+        response = self.request("GET", endpoint, params=params)
+        if response.is_success() and "no-store" not in response.headers.get("Cache-Control", ""):
+            response_cache.set(key, response)
+        return response
     
     def post(
         self,
@@ -326,26 +690,36 @@ class BaseClient:
         """
         return self.request("DELETE", endpoint, **kwargs)
     
-    def set_auth_token(self, token: str) -> None:
+    def _map_concurrently(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        max_workers: Optional[int] = None
+    ) -> List[R]:
         """
-        Set authentication token in default headers.
+        Apply func to each item on a thread pool sharing the client's session.
         
         Args:
-            token: Bearer token
+            func: Callable issuing one request per item
+            items: Items to map over
+            max_workers: Maximum concurrent requests (defaults to parallel_workers)
+            
+        Returns:
+            Results in the same order as items
         """
-        self._default_headers["Authorization"] = f"Bearer {token}"
-        logger.info("Authentication token set")
-    
-    def clear_auth_token(self) -> None:
-        """Remove authentication token from headers."""
-        if "Authorization" in self._default_headers:
-            del self._default_headers["Authorization"]
-            logger.info("Authentication token cleared")
+        items = list(items)
+        if not items:
+            return []
+        
+        workers = min(max_workers or settings.parallel_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
     
     def close(self) -> None:
-        """Close the session."""
-        self.session.close()
-        logger.debug("API client session closed")
+        """Close the session if this client owns it."""
+        if self._owns_session:
+            self.session.close()
+            logger.debug("API client session closed")
     
     def __enter__(self):
         """Context manager entry."""
@@ -354,3 +728,51 @@ class BaseClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+class EndpointsMixin(Generic[ResponseT]):
+    """
+    Base for endpoint method mixins shared by the sync and async clients.
+    
+    Endpoint methods return whatever the transport's HTTP methods return:
+    APIResponse on BaseClient, an awaitable APIResponse on AsyncBaseClient.
+    Mixins must come after the transport class in the bases.
+    """
+    
+    # Collection path and single-item template, set by each mixin
+    endpoint_prefix: str
+    _single_tpl: str
+    
+    if TYPE_CHECKING:
+        def get(
+            self,
+            endpoint: str,
+            params: Optional[Dict[str, Any]] = None,
+            cacheable: bool = False,
+            **kwargs: Any
+        ) -> ResponseT: ...
+        
+        def post(
+            self,
+            endpoint: str,
+            json_data: Optional[Dict[str, Any]] = None,
+            data: Optional[Union[str, Dict[str, Any]]] = None,
+            **kwargs: Any
+        ) -> ResponseT: ...
+        
+        def put(
+            self,
+            endpoint: str,
+            json_data: Optional[Dict[str, Any]] = None,
+            **kwargs: Any
+        ) -> ResponseT: ...
+        
+        def patch(
+            self,
+            endpoint: str,
+            json_data: Optional[Dict[str, Any]] = None,
+            **kwargs: Any
+        ) -> ResponseT: ...
+        
+        def delete(self, endpoint: str, **kwargs: Any) -> ResponseT: ...
+
@@ -3,24 +3,22 @@ Resources API client for ReqRes.in Resource endpoints.
 
 Provides methods for resource-related API operations.
 """
-from typing import Any, Optional
+from typing import Any, List, Optional
 
-from clients.base_client import APIResponse, BaseClient
+from clients.base_client import APIResponse, BaseClient, EndpointsMixin, ResponseT
 
 
-class ResourcesClient(BaseClient):
-    """Client for Resources API endpoints."""
+class ResourcesEndpoints(EndpointsMixin[ResponseT]):
+    """Resources API endpoint methods, shared by the sync and async clients."""
     
-    def __init__(self, **kwargs: Any):
-        """Initialize Resources client."""
-        super().__init__(**kwargs)
-        self.endpoint_prefix = "unknown"  # ReqRes.in uses 'unknown' for resources
+    endpoint_prefix = "unknown"  # ReqRes.in uses 'unknown' for resources
+    _single_tpl = "unknown/%s"
     
     def get_resources(
         self,
         page: Optional[int] = None,
         per_page: Optional[int] = None
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Get list of resources with pagination.
         
@@ -37,9 +35,9 @@ class ResourcesClient(BaseClient):
         if per_page is not None:
             params["per_page"] = per_page
         
-        return self.get(self.endpoint_prefix, params=params)
+        return self.get(self.endpoint_prefix, params=params, cacheable=True)
     
-    def get_resource(self, resource_id: int) -> APIResponse:
+    def get_resource(self, resource_id: int) -> ResponseT:
         """
         Get single resource by ID.
         
@@ -49,7 +47,7 @@ class ResourcesClient(BaseClient):
         Returns:
             APIResponse with resource data
         """
-        return self.get(f"{self.endpoint_prefix}/{resource_id}")
+        return self.get(self._single_tpl % resource_id, cacheable=True)
     
     def create_resource(
         self,
@@ -58,7 +56,7 @@ class ResourcesClient(BaseClient):
         color: str,
         pantone_value: str,
         **additional_fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Create a new resource.
         
@@ -76,16 +74,17 @@ class ResourcesClient(BaseClient):
             "name": name,
             "year": year,
             "color": color,
-            "pantone_value": pantone_value,
-            **additional_fields
+            "pantone_value": pantone_value
         }
+        if additional_fields:
+            data.update(additional_fields)
         return self.post(self.endpoint_prefix, json_data=data)
     
     def update_resource(
         self,
         resource_id: int,
         **fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Update resource using PUT.
         
@@ -96,13 +95,32 @@ class ResourcesClient(BaseClient):
         Returns:
             APIResponse with updated resource data
         """
-        return self.put(f"{self.endpoint_prefix}/{resource_id}", json_data=fields)
+        return self.put(self._single_tpl % resource_id, json_data=fields)
+    
+    def update_resource_raw(self, resource_id: int, body: bytes) -> ResponseT:
+        """
+        Update resource using PUT with an already serialized JSON body.
+        
+        Lets callers reuse one encoded payload instead of serializing per request.
+        
+        Args:
+            resource_id: Resource ID
+            body: JSON-encoded resource fields
+            
+        Returns:
+            APIResponse with updated resource data
+        """
+        return self.put(
+            self._single_tpl % resource_id,
+            data=body,
+            headers={"Content-Type": "application/json"}
+        )
     
     def partial_update_resource(
         self,
         resource_id: int,
         **fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Partially update resource using PATCH.
         
@@ -113,9 +131,9 @@ class ResourcesClient(BaseClient):
         Returns:
             APIResponse with updated resource data
         """
-        return self.patch(f"{self.endpoint_prefix}/{resource_id}", json_data=fields)
+        return self.patch(self._single_tpl % resource_id, json_data=fields)
     
-    def delete_resource(self, resource_id: int) -> APIResponse:
+    def delete_resource(self, resource_id: int) -> ResponseT:
         """
         Delete resource by ID.
         
@@ -125,4 +143,25 @@ class ResourcesClient(BaseClient):
         Returns:
             APIResponse (typically 204 No Content)
         """
-        return self.delete(f"{self.endpoint_prefix}/{resource_id}")
+        return self.delete(self._single_tpl % resource_id)
+
+
+class ResourcesClient(BaseClient, ResourcesEndpoints[APIResponse]):
+    """Client for Resources API endpoints."""
+    
+    def get_resources_bulk(
+        self,
+        resource_ids: List[int],
+        max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Get several resources concurrently over the client's session.
+        
+        Args:
+            resource_ids: Resource IDs, each passed to get_resource
+            max_workers: Maximum concurrent requests (defaults to parallel_workers)
+            
+        Returns:
+            List of APIResponse in the same order as resource_ids
+        """
+        return self._map_concurrently(self.get_resource, resource_ids, max_workers)
@@ -3,24 +3,22 @@ Users API client for ReqRes.in Users endpoints.
 
 Provides methods for all user-related API operations.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Mapping, Optional, Sequence
 
-from clients.base_client import APIResponse, BaseClient
+from clients.base_client import APIResponse, BaseClient, EndpointsMixin, ResponseT
 
 
-class UsersClient(BaseClient):
-    """Client for Users API endpoints."""
+class UsersEndpoints(EndpointsMixin[ResponseT]):
+    """Users API endpoint methods, shared by the sync and async clients."""
     
-    def __init__(self, **kwargs: Any):
-        """Initialize Users client."""
-        super().__init__(**kwargs)
-        self.endpoint_prefix = "users"
+    endpoint_prefix = "users"
+    _single_tpl = "users/%s"
     
     def get_users(
         self,
         page: Optional[int] = None,
         per_page: Optional[int] = None
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Get list of users with pagination.
         
@@ -37,9 +35,9 @@ class UsersClient(BaseClient):
         if per_page is not None:
             params["per_page"] = per_page
         
-        return self.get(self.endpoint_prefix, params=params)
+        return self.get(self.endpoint_prefix, params=params, cacheable=True)
     
-    def get_user(self, user_id: int) -> APIResponse:
+    def get_user(self, user_id: int) -> ResponseT:
         """
         Get single user by ID.
         
@@ -49,14 +47,14 @@ class UsersClient(BaseClient):
         Returns:
             APIResponse with user data
         """
-        return self.get(f"{self.endpoint_prefix}/{user_id}")
+        return self.get(self._single_tpl % user_id, cacheable=True)
     
     def create_user(
         self,
         name: str,
         job: str,
         **additional_fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Create a new user.
         
@@ -70,9 +68,10 @@ class UsersClient(BaseClient):
         """
         data = {
             "name": name,
-            "job": job,
-            **additional_fields
+            "job": job
         }
+        if additional_fields:
+            data.update(additional_fields)
         return self.post(self.endpoint_prefix, json_data=data)
     
     def update_user(
@@ -81,7 +80,7 @@ class UsersClient(BaseClient):
         name: Optional[str] = None,
         job: Optional[str] = None,
         **additional_fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Update user using PUT (full update).
         
@@ -99,15 +98,16 @@ class UsersClient(BaseClient):
             data["name"] = name
         if job is not None:
             data["job"] = job
-        data.update(additional_fields)
+        if additional_fields:
+            data.update(additional_fields)
         
-        return self.put(f"{self.endpoint_prefix}/{user_id}", json_data=data)
+        return self.put(self._single_tpl % user_id, json_data=data)
     
     def partial_update_user(
         self,
         user_id: int,
         **fields: Any
-    ) -> APIResponse:
+    ) -> ResponseT:
         """
         Partially update user using PATCH.
         
@@ -118,9 +118,9 @@ class UsersClient(BaseClient):
         Returns:
             APIResponse with updated user data
         """
-        return self.patch(f"{self.endpoint_prefix}/{user_id}", json_data=fields)
+        return self.patch(self._single_tpl % user_id, json_data=fields)
     
-    def delete_user(self, user_id: int) -> APIResponse:
+    def delete_user(self, user_id: int) -> ResponseT:
         """
         Delete user by ID.
         
@@ -130,9 +130,9 @@ class UsersClient(BaseClient):
         Returns:
             APIResponse (typically 204 No Content)
         """
-        return self.delete(f"{self.endpoint_prefix}/{user_id}")
+        return self.delete(self._single_tpl % user_id)
     
-    def get_delayed_users(self, delay: int = 3) -> APIResponse:
+    def get_delayed_users(self, delay: int = 3) -> ResponseT:
         """
         Get users with artificial delay (for performance testing).
         
@@ -142,4 +142,63 @@ class UsersClient(BaseClient):
         Returns:
             APIResponse with users after delay
         """
-        return self.get(f"{self.endpoint_prefix}?delay={delay}")
+        return self.get(self.endpoint_prefix, params={"delay": delay})
+
+
+class UsersClient(BaseClient, UsersEndpoints[APIResponse]):
+    """Client for Users API endpoints."""
+    
+    def get_users_bulk(
+        self,
+        user_ids: Sequence[int],
+        max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Get several users concurrently over the client's session.
+        
+        Args:
+            user_ids: User IDs, each passed to get_user
+            max_workers: Maximum concurrent requests (defaults to parallel_workers)
+            
+        Returns:
+            List of APIResponse in the same order as user_ids
+        """
+        return self._map_concurrently(self.get_user, user_ids, max_workers)
+    
+    def get_users_pages(
+        self,
+        pages: Sequence[int],
+        max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Get several pages of the users list concurrently.
+        
+        Args:
+            pages: Page numbers, each passed to get_users
+            max_workers: Maximum concurrent requests (defaults to parallel_workers)
+            
+        Returns:
+            List of APIResponse in the same order as pages
+        """
+        return self._map_concurrently(
+            lambda page: self.get_users(page=page),
+            pages,
+            max_workers
+        )
+    
+    def create_users_bulk(
+        self,
+        users: Sequence[Mapping[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[APIResponse]:
+        """
+        Create several users concurrently over the client's session.
+        
+        Args:
+            users: User payloads, each passed to create_user
+            max_workers: Maximum concurrent requests (defaults to parallel_workers)
+            
+        Returns:
+            List of APIResponse in the same order as users
+        """
+        return self._map_concurrently(lambda user: self.create_user(**user), users, max_workers)
@@ -3,11 +3,31 @@ Configuration management for API test automation framework.
 
 Uses Pydantic Settings for type-safe configuration with environment variable support.
 """
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from utils.lazy import LazyProxy
+
+
+@lru_cache(maxsize=512)
+def join_url(base_url: str, endpoint: str) -> str:
+    """
+    Join base URL and endpoint with exactly one slash between them.
+    
+    Results are memoized since clients hit a small, fixed set of endpoints.
+    
+    Args:
+        base_url: Base URL
+        endpoint: API endpoint path
+        
+    Returns:
+        Full URL
+    """
+    return f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
 
 class Settings(BaseSettings):
     """
@@ -61,6 +81,14 @@ class Settings(BaseSettings):
         default=True,
         description="Enable/disable request/response logging"
     )
+    log_dir: str = Field(
+        default="logs",
+        description="Directory for per-run log files"
+    )
+    live_test_log: bool = Field(
+        default=False,
+        description="Log test start/end as they happen instead of in one write at session end"
+    )
     
     # Authentication
     api_username: Optional[str] = Field(
@@ -83,6 +111,19 @@ class Settings(BaseSettings):
         le=16,
         description="Number of parallel workers for test execution"
     )
+    http_pool_maxsize: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Keep-alive connections per host (defaults to 8 per worker, at least 64)"
+    )
+    http_pool_block: bool = Field(
+        default=False,
+        description="Block when the connection pool is full instead of opening extra connections"
+    )
+    enable_response_cache: bool = Field(
+        default=True,
+        description="Cache successful responses of idempotent GET endpoints for the test session"
+    )
     slow_test_threshold: float = Field(
         default=5.0,
         ge=0.1,
@@ -98,6 +139,10 @@ class Settings(BaseSettings):
         default="reports/html",
         description="Directory for HTML test reports"
     )
+    allure_optimize: bool = Field(
+        default=False,
+        description="Skip Allure attachments and dynamic labels for a lean report"
+    )
     
     # Performance Testing
     performance_threshold_ms: int = Field(
@@ -120,9 +165,7 @@ class Settings(BaseSettings):
         Returns:
             Full URL with proper formatting
         """
-        base = self.api_base_url.rstrip("/")
-        endpoint = endpoint.lstrip("/")
-        return f"{base}/{endpoint}"
+        return join_url(self.api_base_url, endpoint)
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -133,5 +176,18 @@ class Settings(BaseSettings):
         return self.log_level.upper() == "DEBUG"
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the memoized settings instance.
+    
+    Settings are read from the environment and .env file on first call only.
+    
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
+
+
+# Global settings instance, validated on first attribute access
+settings: Settings = LazyProxy(get_settings)  # type: ignore[assignment]
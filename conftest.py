@@ -3,21 +3,61 @@ Pytest configuration and fixtures for API test automation.
 
 Provides reusable fixtures for API clients, test data, and test utilities.
 """
-import json
-from typing import Any, Dict, Generator
+import re
+import time
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Dict, FrozenSet, Generator, List, Literal, Mapping, Tuple
 
 import allure
+import orjson
 import pytest
+import pytest_asyncio
+import requests
 from _pytest.nodes import Item
 from _pytest.runner import CallInfo
 
+from clients._transport import close_shared_connector
+from clients.async_clients import AsyncAuthClient, AsyncResourcesClient, AsyncUsersClient
 from clients.auth_client import AuthClient
+from clients.base_client import APIResponse, BaseClient
 from clients.resources_client import ResourcesClient
 from clients.users_client import UsersClient
 from config.settings import settings
 from utils.logger import logger
+from utils.response_cache import response_cache
+from utils.schema_cache import get_validator
 from utils.test_data import test_data
 
+# Login tokens keyed by (email, password), so each credential set logs in once per run
+_TOKEN_CACHE: Dict[Tuple[str, str], str] = {}
+
+# Test start/end log events buffered per session unless LIVE_TEST_LOG is set
+_TEST_EVENTS_KEY = pytest.StashKey[List[Tuple[str, int, str, str]]]()
+
+# Pretty-printing options for JSON Allure attachments
+_ORJSON_INDENT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Marker names of each item, computed once in pytest_collection_modifyitems
+_MARKER_NAMES_KEY = pytest.StashKey[FrozenSet[str]]()
+
+# Markers added from test path keywords in pytest_collection_modifyitems
+_PATH_MARKER_RE = re.compile(r"users|resources|auth|workflows|negative")
+
+
+def _is_recording(config: pytest.Config) -> bool:
+    """Whether cassettes are recorded or replayed in this run (--record-mode)."""
+    return bool(config.getoption("--record-mode", None))
+
+
+def _replay_scope(fixture_name: str, config: pytest.Config) -> Literal["function", "session"]:
+    """
+    Scope shared API responses per session, or per test when recording.
+    
+    Cassettes are entered per test, so a request made by a session fixture
+    would be neither recorded nor replayed.
+    """
+    return "function" if _is_recording(config) else "session"
+
 
 # ============================================================================
 # Session-scoped fixtures
@@ -34,62 +74,143 @@ def api_base_url() -> str:
     return settings.api_base_url
 
 
+@pytest.fixture(scope="session")
+def shared_http_session(pytestconfig: pytest.Config) -> Generator[requests.Session, None, None]:
+    """
+    Provide one HTTP session shared by all API clients.
+    
+    Reusing the session keeps its connection pool (and TCP/TLS connections)
+    alive across tests instead of reconnecting for every client.
+    
+    Args:
+        pytestconfig: Pytest config
+        
+    Yields:
+        Configured requests.Session
+    """
+    session = BaseClient.create_session()
+    
+    # Open the first keep-alive connection (TCP + TLS) before any test is timed;
+    # skipped with cassettes, where it would run outside any of them
+    if not _is_recording(pytestconfig):
+        try:
+            session.head(settings.api_base_url, timeout=settings.api_timeout)
+        except requests.RequestException as e:
+            logger.warning(f"Connection pre-warm failed: {e}")
+    
+    yield session
+    session.close()
+
+
 # ============================================================================
-# Function-scoped API client fixtures
+# Session-scoped API client fixtures
 # ============================================================================
+# These clients are never authenticated; authenticated_clients builds its
+# own instances on the same HTTP session.
 
-@pytest.fixture
-def users_client() -> Generator[UsersClient, None, None]:
+@pytest.fixture(scope="session")
+def users_client(shared_http_session: requests.Session) -> UsersClient:
     """
-    Provide Users API client.
+    Provide Users API client shared across the test session.
     
-    Yields:
+    Args:
+        shared_http_session: Session-wide HTTP session
+        
+    Returns:
         UsersClient instance
     """
-    client = UsersClient()
+    return UsersClient(session=shared_http_session)
+
+
+@pytest.fixture(scope="session")
+def resources_client(shared_http_session: requests.Session) -> ResourcesClient:
+    """
+    Provide Resources API client shared across the test session.
+    
+    Args:
+        shared_http_session: Session-wide HTTP session
+        
+    Returns:
+        ResourcesClient instance
+    """
+    return ResourcesClient(session=shared_http_session)
+
+
+@pytest.fixture(scope="session")
+def auth_client(shared_http_session: requests.Session) -> AuthClient:
+    """
+    Provide Auth API client shared across the test session.
+    
+    Args:
+        shared_http_session: Session-wide HTTP session
+        
+    Returns:
+        AuthClient instance
+    """
+    return AuthClient(session=shared_http_session)
+
+
+# ============================================================================
+# Function-scoped async API client fixtures
+# ============================================================================
+# Each async test runs on its own event loop, so the fixtures also close
+# that loop's shared connector on teardown.
+
+@pytest_asyncio.fixture
+async def async_users_client() -> AsyncGenerator[AsyncUsersClient, None]:
+    """
+    Provide async Users API client.
+    
+    Yields:
+        AsyncUsersClient instance
+    """
+    client = AsyncUsersClient()
     yield client
-    client.close()
+    await client.close()
+    await close_shared_connector()
 
 
-@pytest.fixture
-def resources_client() -> Generator[ResourcesClient, None, None]:
+@pytest_asyncio.fixture
+async def async_resources_client() -> AsyncGenerator[AsyncResourcesClient, None]:
     """
-    Provide Resources API client.
+    Provide async Resources API client.
     
     Yields:
-        ResourcesClient instance
+        AsyncResourcesClient instance
     """
-    client = ResourcesClient()
+    client = AsyncResourcesClient()
     yield client
-    client.close()
+    await client.close()
+    await close_shared_connector()
 
 
-@pytest.fixture
-def auth_client() -> Generator[AuthClient, None, None]:
+@pytest_asyncio.fixture
+async def async_auth_client() -> AsyncGenerator[AsyncAuthClient, None]:
     """
-    Provide Auth API client.
+    Provide async Auth API client.
     
     Yields:
-        AuthClient instance
+        AsyncAuthClient instance
     """
-    client = AuthClient()
+    client = AsyncAuthClient()
     yield client
-    client.close()
+    await client.close()
+    await close_shared_connector()
 
 
 # ============================================================================
 # Test data fixtures
 # ============================================================================
 
-@pytest.fixture
-def user_data() -> Dict[str, str]:
+@pytest.fixture(scope="session")
+def user_data() -> Mapping[str, str]:
     """
-    Generate random user data.
+    Generate random user data (shared per session, read-only).
     
     Returns:
-        Dictionary with name and job
+        Read-only mapping with name and job
     """
-    return test_data.generate_user_data()
+    return MappingProxyType(test_data.generate_user_data())
 
 
 @pytest.fixture
@@ -125,41 +246,41 @@ def resource_data() -> Dict[str, Any]:
     return test_data.generate_resource_data()
 
 
-@pytest.fixture
-def valid_auth_data() -> Dict[str, str]:
+@pytest.fixture(scope="session")
+def valid_auth_data() -> Mapping[str, str]:
     """
-    Generate valid authentication data.
+    Generate valid authentication data (fixed credentials, shared per session).
     
     Returns:
-        Dictionary with email and password
+        Read-only mapping with email and password
     """
     return test_data.generate_auth_data(valid=True)
 
 
-@pytest.fixture
-def invalid_auth_data() -> Dict[str, str]:
+@pytest.fixture(scope="module")
+def invalid_auth_data() -> Mapping[str, str]:
     """
-    Generate invalid authentication data.
+    Generate invalid authentication data (shared per module, read-only).
     
     Returns:
-        Dictionary with invalid credentials
+        Read-only mapping with invalid credentials
     """
-    return test_data.generate_auth_data(valid=False)
+    return MappingProxyType(test_data.generate_auth_data(valid=False))
 
 
-@pytest.fixture
-def valid_register_data() -> Dict[str, str]:
+@pytest.fixture(scope="session")
+def valid_register_data() -> Mapping[str, str]:
     """
-    Generate valid registration data.
+    Generate valid registration data (fixed credentials, shared per session).
     
     Returns:
-        Dictionary with email and password
+        Read-only mapping with email and password
     """
     return test_data.generate_register_data(valid=True)
 
 
 @pytest.fixture
-def invalid_register_data() -> Dict[str, str]:
+def invalid_register_data() -> Mapping[str, str]:
     """
     Generate invalid registration data.
     
@@ -169,46 +290,64 @@ def invalid_register_data() -> Dict[str, str]:
     return test_data.generate_register_data(valid=False)
 
 
-@pytest.fixture
-def bulk_users_data() -> list:
+@pytest.fixture(scope="session")
+def bulk_users_data() -> Tuple[Mapping[str, str], ...]:
     """
-    Generate bulk user data for testing.
+    Generate bulk user data once per session (read-only).
     
     Returns:
-        List of user dictionaries
+        Tuple of read-only user mappings
     """
-    return test_data.generate_bulk_users(count=10)
+    return tuple(MappingProxyType(user) for user in test_data.generate_bulk_users(count=10))
 
 
 @pytest.fixture
-def sql_injection_payloads() -> list:
+def bulk_users_created(
+    users_client: UsersClient,
+    bulk_users_data: Tuple[Mapping[str, str], ...]
+) -> List[APIResponse]:
+    """
+    Create the bulk users concurrently.
+    
+    Args:
+        users_client: Users API client
+        bulk_users_data: Bulk user data
+        
+    Returns:
+        List of creation responses, in bulk_users_data order
+    """
+    return users_client.create_users_bulk(bulk_users_data)
+
+
+@pytest.fixture(scope="session")
+def sql_injection_payloads() -> Tuple[str, ...]:
     """
-    Generate SQL injection test payloads.
+    Generate SQL injection test payloads (shared per session).
     
     Returns:
-        List of SQL injection strings
+        Tuple of SQL injection strings
     """
     return test_data.generate_sql_injection_payloads()
 
 
-@pytest.fixture
-def xss_payloads() -> list:
+@pytest.fixture(scope="session")
+def xss_payloads() -> Tuple[str, ...]:
     """
-    Generate XSS test payloads.
+    Generate XSS test payloads (shared per session).
     
     Returns:
-        List of XSS strings
+        Tuple of XSS strings
     """
     return test_data.generate_xss_payloads()
 
 
-@pytest.fixture
-def boundary_values() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def boundary_values() -> Mapping[str, Any]:
     """
-    Generate boundary test values.
+    Generate boundary test values (shared per session, read-only).
     
     Returns:
-        Dictionary with boundary values
+        Mapping with boundary values
     """
     return test_data.generate_boundary_values()
 
@@ -217,10 +356,10 @@ def boundary_values() -> Dict[str, Any]:
 # Helper fixtures
 # ============================================================================
 
-@pytest.fixture
-def auth_token(auth_client: AuthClient, valid_auth_data: Dict[str, str]) -> str:
+@pytest.fixture(scope="session")
+def auth_token(auth_client: AuthClient, valid_auth_data: Mapping[str, str]) -> str:
     """
-    Get authentication token by logging in.
+    Get authentication token by logging in once per test session.
     
     Args:
         auth_client: Auth API client
@@ -229,26 +368,135 @@ def auth_token(auth_client: AuthClient, valid_auth_data: Dict[str, str]) -> str:
     Returns:
         Authentication token
     """
-    response = auth_client.login(**valid_auth_data)
-    assert response.is_success(), "Login failed"
-    return response.json.get("token")
+    key = (valid_auth_data["email"], valid_auth_data["password"])
+    token = _TOKEN_CACHE.get(key)
+    if token is None:
+        response = auth_client.login(**valid_auth_data)
+        assert response.is_success(), "Login failed"
+        token = _TOKEN_CACHE[key] = response.json["token"]
+    return token
 
 
 @pytest.fixture
-def created_user(users_client: UsersClient, user_data: Dict[str, str]) -> Dict[str, Any]:
+def authenticated_clients(
+    auth_token: str,
+    shared_http_session: requests.Session
+) -> Tuple[UsersClient, ResourcesClient]:
     """
-    Create a user for testing (returns user data with ID).
+    Provide users/resources clients authenticated for a single test.
+    
+    The clients are created per test on the shared HTTP session, so the
+    session-scoped clients never carry a token.
+    
+    Args:
+        auth_token: Session authentication token
+        shared_http_session: Session-wide HTTP session
+        
+    Returns:
+        Authenticated (UsersClient, ResourcesClient)
+    """
+    users = UsersClient(session=shared_http_session)
+    resources = ResourcesClient(session=shared_http_session)
+    users.set_auth_token(auth_token)
+    resources.set_auth_token(auth_token)
+    return users, resources
+
+
+@pytest.fixture(scope="session")
+def created_user(users_client: UsersClient) -> Mapping[str, Any]:
+    """
+    Create a user once per test session (returns user data with ID).
+    
+    The result is shared by all tests, so it is returned read-only.
     
     Args:
         users_client: Users API client
-        user_data: User data to create
         
     Returns:
-        Created user data with ID
+        Read-only created user data with ID
     """
-    response = users_client.create_user(**user_data)
+    response = users_client.create_user(**test_data.generate_user_data())
     assert response.is_success(), "User creation failed"
-    return response.json
+    return MappingProxyType(response.json)
+
+
+@pytest.fixture(scope="session")
+def user_1_response(users_client: UsersClient) -> APIResponse:
+    """
+    Fetch user #1 once per test session for read-only field checks.
+    
+    Args:
+        users_client: Users API client
+        
+    Returns:
+        APIResponse for GET /users/1
+    """
+    return users_client.get_user(1)
+
+
+@pytest.fixture(scope=_replay_scope)
+def resources_1_and_2(
+    request: pytest.FixtureRequest,
+    resources_client: ResourcesClient
+) -> Mapping[int, APIResponse]:
+    """
+    Fetch resources #1 and #2 concurrently once per test session.
+    
+    With cassettes they are fetched one by one for each test instead:
+    VCR.py drops requests sent from the bulk fetch's worker threads.
+    
+    Args:
+        request: Fixture request
+        resources_client: Resources API client
+        
+    Returns:
+        Read-only mapping of resource ID to its GET /unknown/{id} response
+    """
+    resource_ids = (1, 2)
+    if _is_recording(request.config):
+        responses = [resources_client.get_resource(resource_id) for resource_id in resource_ids]
+    else:
+        responses = resources_client.get_resources_bulk(list(resource_ids))
+    return MappingProxyType(dict(zip(resource_ids, responses)))
+
+
+@pytest.fixture(scope=_replay_scope)
+def resource_1_response(
+    request: pytest.FixtureRequest,
+    resources_client: ResourcesClient
+) -> APIResponse:
+    """
+    Provide the resource #1 response for read-only field checks.
+    
+    Shared from resources_1_and_2, or fetched per test with cassettes.
+    
+    Args:
+        request: Fixture request
+        resources_client: Resources API client
+        
+    Returns:
+        APIResponse for GET /unknown/1
+    """
+    if _is_recording(request.config):
+        return resources_client.get_resource(1)
+    shared: Mapping[int, APIResponse] = request.getfixturevalue("resources_1_and_2")
+    return shared[1]
+
+
+@pytest.fixture(scope="session")
+def update_resource_body() -> bytes:
+    """
+    Provide the fixed resource update payload, JSON-encoded once per session.
+    
+    Returns:
+        Serialized resource fields
+    """
+    return orjson.dumps({
+        "name": "Updated Resource",
+        "year": 2024,
+        "color": "#FF5733",
+        "pantone_value": "19-1664"
+    })
 
 
 @pytest.fixture(params=[1, 2])
@@ -295,10 +543,76 @@ def non_existent_resource_id() -> int:
     return 99999
 
 
+# ============================================================================
+# Recorded HTTP replay (pytest-recording / VCR.py)
+# ============================================================================
+# Modules marked with pytest.mark.vcr run live by default. Passing
+# --record-mode records cassettes on first run (once) and replays them after,
+# or replays strictly offline (none).
+
+@pytest.fixture(scope="session")
+def disable_recording(request) -> bool:
+    """
+    Keep VCR.py off unless a record mode is requested on the command line.
+    
+    Returns:
+        Whether cassette recording/replay is disabled
+    """
+    return (
+        request.config.getoption("--disable-recording")
+        or request.config.getoption("--record-mode") is None
+    )
+
+
+@pytest.fixture(scope="session")
+def vcr_config() -> Dict[str, Any]:
+    """
+    Provide VCR.py cassette settings.
+    
+    Request bodies are not matched since payloads are randomly generated;
+    parametrized cases each get their own cassette instead.
+    
+    Returns:
+        Keyword arguments for VCR.use_cassette
+    """
+    return {
+        "filter_headers": ["authorization"],
+        "match_on": ["method", "scheme", "host", "path", "query"],
+    }
+
+
 # ============================================================================
 # Pytest hooks for logging and reporting
 # ============================================================================
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Bypass the response cache when replaying cassettes."""
+    # A GET served from the cache never reaches a cassette, so replay would
+    # depend on which test happened to fetch it first
+    if _is_recording(config):
+        settings.enable_response_cache = False
+
+
+def _record_test_event(item: Item, event: str, status: str = "") -> None:
+    """
+    Log a test start/end event, buffering it unless live logging is enabled.
+    
+    Args:
+        item: Test item
+        event: "start" or "end"
+        status: Test outcome for end events
+    """
+    if settings.live_test_log:
+        if event == "start":
+            logger.log_test_start(item.nodeid)
+        else:
+            logger.log_test_end(item.nodeid, status)
+        return
+    
+    events: List[Tuple[str, int, str, str]] = item.session.stash.setdefault(_TEST_EVENTS_KEY, [])
+    events.append((event, time.monotonic_ns(), item.nodeid, status))
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator:
     """
@@ -313,14 +627,13 @@ def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator:
     
     if report.when == "call":
         # Log test result
-        test_name = item.nodeid
         if report.passed:
-            logger.log_test_end(test_name, "PASSED")
+            _record_test_event(item, "end", "PASSED")
         elif report.failed:
-            logger.log_test_end(test_name, "FAILED")
+            _record_test_event(item, "end", "FAILED")
             
-            # Attach failure info to Allure
-            if hasattr(report, 'longreprtext'):
+            # Attach failure info to Allure; only failures pay for the write
+            if hasattr(report, 'longreprtext') and not settings.allure_optimize:
                 allure.attach(
                     report.longreprtext,
                     name="Failure Details",
@@ -335,12 +648,20 @@ def pytest_runtest_setup(item: Item) -> None:
     Args:
         item: Test item
     """
-    logger.log_test_start(item.nodeid)
+    _record_test_event(item, "start")
+    
+    if settings.allure_optimize:
+        return
     
     # Attach test info to Allure
     if hasattr(item, 'obj') and hasattr(item.obj, '__doc__'):
         if item.obj.__doc__:
             allure.dynamic.description(item.obj.__doc__)
+    
+    # Add Allure labels
+    if "smoke" in item.stash.get(_MARKER_NAMES_KEY, frozenset()):
+        allure.dynamic.tag("smoke")
+        allure.dynamic.severity(allure.severity_level.CRITICAL)
 
 
 def pytest_collection_modifyitems(items: list) -> None:
@@ -352,21 +673,34 @@ def pytest_collection_modifyitems(items: list) -> None:
     """
     for item in items:
         # Add markers based on test path
-        if "users" in item.nodeid:
-            item.add_marker(pytest.mark.users)
-        if "resources" in item.nodeid:
-            item.add_marker(pytest.mark.resources)
-        if "auth" in item.nodeid:
-            item.add_marker(pytest.mark.auth)
-        if "workflows" in item.nodeid:
-            item.add_marker(pytest.mark.workflows)
-        if "negative" in item.nodeid:
-            item.add_marker(pytest.mark.negative)
+        for name in set(_PATH_MARKER_RE.findall(item.nodeid)):
+            item.add_marker(getattr(pytest.mark, name))
         
-        # Add Allure labels
-        if "smoke" in [mark.name for mark in item.iter_markers()]:
-            allure.dynamic.tag("smoke")
-            allure.dynamic.severity(allure.severity_level.CRITICAL)
+        # Keep each module on one xdist worker (--dist=loadgroup) so its
+        # session-scoped fixtures, e.g. the login token, are built once;
+        # parametrized cases stay ungrouped so xdist can spread them out
+        marker_names = frozenset(mark.name for mark in item.iter_markers())
+        item.stash[_MARKER_NAMES_KEY] = marker_names
+        if "xdist_group" not in marker_names and not hasattr(item, "callspec"):
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Hook called after the whole test run finishes.
+    
+    Args:
+        session: Pytest session
+        exitstatus: Exit status of the test run
+    """
+    logger.debug(
+        f"Response cache: {response_cache.hits} hits, {response_cache.misses} misses"
+    )
+    response_cache.clear()
+    
+    # Flush buffered test start/end log lines in one write
+    events: List[Tuple[str, int, str, str]] = session.stash.get(_TEST_EVENTS_KEY, [])
+    logger.write_bulk(events)
 
 
 # ============================================================================
@@ -416,16 +750,17 @@ def assert_performance(performance_threshold: float):
 # JSON Schema validation helper
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validate_json_schema():
     """
-    Provide JSON schema validation helper.
+    Provide JSON schema validation helper (session-scoped).
+    
+    Schemas are compiled with fastjsonschema once per run and cached by
+    identity; schemas fastjsonschema cannot compile fall back to jsonschema.
     
     Returns:
         Helper function to validate JSON against schema
     """
-    from jsonschema import validate, ValidationError
-    
     def _validate(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
         """
         Validate data against JSON schema.
@@ -435,13 +770,14 @@ def validate_json_schema():
             schema: JSON schema
             
         Raises:
-            ValidationError: If validation fails
+            JsonSchemaValueException: If validation fails (jsonschema ValidationError on fallback)
         """
+        validator = get_validator(schema)
         try:
-            validate(instance=data, schema=schema)
+            validator(data)
             logger.info("✓ JSON schema validation passed")
-        except ValidationError as e:
-            logger.error(f"✗ JSON schema validation failed: {e.message}")
+        except Exception as e:
+            logger.error(f"✗ JSON schema validation failed: {getattr(e, 'message', e)}")
             raise
     
     return _validate
@@ -457,8 +793,11 @@ def attach_request_to_allure():
     Provide helper to attach request details to Allure report.
     
     Returns:
-        Helper function
+        Helper function (a no-op when ALLURE_OPTIMIZE is set)
     """
+    if settings.allure_optimize:
+        return lambda method, url, **kwargs: None
+    
     def _attach(method: str, url: str, **kwargs: Any) -> None:
         """
         Attach request details to Allure.
@@ -474,7 +813,7 @@ def attach_request_to_allure():
             **kwargs
         }
         allure.attach(
-            json.dumps(request_info, indent=2),
+            orjson.dumps(request_info, option=_ORJSON_INDENT).decode(),
             name="Request Details",
             attachment_type=allure.attachment_type.JSON
         )
@@ -488,8 +827,11 @@ def attach_response_to_allure():
     Provide helper to attach response details to Allure report.
     
     Returns:
-        Helper function
+        Helper function (a no-op when ALLURE_OPTIMIZE is set)
     """
+    if settings.allure_optimize:
+        return lambda status_code, body, elapsed_time: None
+    
     def _attach(status_code: int, body: Dict[str, Any], elapsed_time: float) -> None:
         """
         Attach response details to Allure.
@@ -505,7 +847,7 @@ def attach_response_to_allure():
             "body": body
         }
         allure.attach(
-            json.dumps(response_info, indent=2),
+            orjson.dumps(response_info, option=_ORJSON_INDENT).decode(),
             name="Response Details",
             attachment_type=allure.attachment_type.JSON
         )
@@ -3,10 +3,40 @@ Pydantic models for API request/response schema validation.
 
 Provides type-safe models for all API entities with validation.
 """
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    HttpUrl,
+    SkipValidation,
+    TypeAdapter,
+    WithJsonSchema,
+    field_validator,
+)
+
+# Hex color pattern shared by the models and the JSON schemas
+HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=4096)
+def _parse_email(value: str) -> str:
+    """Validate an email address once per distinct string."""
+    return _EMAIL_ADAPTER.validate_python(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(value: str) -> HttpUrl:
+    """Validate an HTTP URL once per distinct string."""
+    return _URL_ADAPTER.validate_python(value)
 
 
 class Support(BaseModel):
@@ -17,11 +47,25 @@ class Support(BaseModel):
 
 class User(BaseModel):
     """User model for API responses."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     id: int
-    email: EmailStr
+    email: Annotated[str, WithJsonSchema({"type": "string", "format": "email"})]
     first_name: str
     last_name: str
-    avatar: HttpUrl
+    avatar: SkipValidation[HttpUrl]
+    
+    @field_validator('email', mode='before')
+    @classmethod
+    def validate_email(cls, v: Any) -> str:
+        """Validate email format (memoized per raw value)."""
+        return _parse_email(v) if isinstance(v, str) else _EMAIL_ADAPTER.validate_python(v)
+    
+    @field_validator('avatar', mode='before')
+    @classmethod
+    def validate_avatar(cls, v: Any) -> HttpUrl:
+        """Validate avatar URL (memoized per raw value)."""
+        return _parse_url(v) if isinstance(v, str) else _URL_ADAPTER.validate_python(v)
     
     @field_validator('id')
     @classmethod
@@ -93,10 +137,12 @@ class SingleUserResponse(BaseModel):
 
 class Resource(BaseModel):
     """Resource model for API responses."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     id: int
     name: str
     year: int = Field(..., ge=1900, le=2100)
-    color: str = Field(..., pattern=r'^#[0-9A-Fa-f]{6}$')  # Hex color
+    color: str = Field(..., pattern=HEX_COLOR_RE.pattern)  # Hex color
     pantone_value: str
     
     @field_validator('id')
@@ -112,7 +158,7 @@ class ResourceCreate(BaseModel):
     """Model for resource creation requests."""
     name: str = Field(..., min_length=1, max_length=100)
     year: int = Field(..., ge=1900, le=2100)
-    color: str = Field(..., pattern=r'^#[0-9A-Fa-f]{6}$')
+    color: str = Field(..., pattern=HEX_COLOR_RE.pattern)
     pantone_value: str = Field(..., min_length=1)
 
 
@@ -195,6 +241,7 @@ class DelayedResponse(BaseModel):
 
 
 # Schema validation helper functions
+# model_validate reuses each model's core validator, compiled once at class creation
 def validate_user_schema(data: Dict[str, Any]) -> User:
     """
     Validate user data against User schema.
@@ -208,7 +255,7 @@ def validate_user_schema(data: Dict[str, Any]) -> User:
     Raises:
         ValidationError: If validation fails
     """
-    return User(**data)
+    return User.model_validate(data)
 
 
 def validate_users_list_schema(data: Dict[str, Any]) -> UsersListResponse:
@@ -224,7 +271,7 @@ def validate_users_list_schema(data: Dict[str, Any]) -> UsersListResponse:
     Raises:
         ValidationError: If validation fails
     """
-    return UsersListResponse(**data)
+    return UsersListResponse.model_validate(data)
 
 
 def validate_resource_schema(data: Dict[str, Any]) -> Resource:
@@ -240,7 +287,7 @@ def validate_resource_schema(data: Dict[str, Any]) -> Resource:
     Raises:
         ValidationError: If validation fails
     """
-    return Resource(**data)
+    return Resource.model_validate(data)
 
 
 def validate_error_response(data: Dict[str, Any]) -> ErrorResponse:
@@ -256,7 +303,7 @@ def validate_error_response(data: Dict[str, Any]) -> ErrorResponse:
     Raises:
         ValidationError: If validation fails
     """
-    return ErrorResponse(**data)
+    return ErrorResponse.model_validate(data)
 
 
 # Schema dictionaries for JSON Schema validation
@@ -272,7 +319,9 @@ USER_SCHEMA = {
     "required": ["id", "email", "first_name", "last_name", "avatar"]
 }
 
+# USER_SCHEMA is shared by reference through $defs so validators compile it once
 USERS_LIST_SCHEMA = {
+    "$defs": {"user": USER_SCHEMA},
     "type": "object",
     "properties": {
         "page": {"type": "integer", "minimum": 1},
@@ -281,7 +330,7 @@ USERS_LIST_SCHEMA = {
         "total_pages": {"type": "integer", "minimum": 0},
         "data": {
             "type": "array",
-            "items": USER_SCHEMA
+            "items": {"$ref": "#/$defs/user"}
         },
         "support": {
             "type": "object",
@@ -301,7 +350,7 @@ RESOURCE_SCHEMA = {
         "id": {"type": "integer", "minimum": 1},
         "name": {"type": "string", "minLength": 1},
         "year": {"type": "integer", "minimum": 1900, "maximum": 2100},
-        "color": {"type": "string", "pattern": "^#[0-9A-Fa-f]{6}$"},
+        "color": {"type": "string", "pattern": HEX_COLOR_RE.pattern},
         "pantone_value": {"type": "string", "minLength": 1}
     },
     "required": ["id", "name", "year", "color", "pantone_value"]
@@ -3,11 +3,23 @@ Authentication API test suite.
 
 Tests cover login, registration, token validation, and security scenarios.
 """
+import asyncio
+import re
+from typing import Mapping
+
 import allure
 import pytest
 
+from clients.async_clients import AsyncAuthClient
 from clients.auth_client import AuthClient
 from models.schemas import ERROR_SCHEMA, validate_error_response
+from utils.test_data import test_data
+
+# Payloads are parametrized so xdist can spread them across workers
+SQL_INJECTION_PAYLOADS = test_data.generate_sql_injection_payloads()
+XSS_PAYLOADS = test_data.generate_xss_payloads()
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]+")
 
 
 @pytest.mark.auth
@@ -17,7 +29,11 @@ from models.schemas import ERROR_SCHEMA, validate_error_response
 class TestRegister:
     """Tests for POST /register endpoint."""
     
-    def test_register_successful(self, auth_client: AuthClient, valid_register_data: dict):
+    def test_register_successful(
+        self,
+        auth_client: AuthClient,
+        valid_register_data: Mapping[str, str]
+    ):
         """Test successful user registration."""
         response = auth_client.register(**valid_register_data)
         
@@ -27,7 +43,11 @@ class TestRegister:
         assert "token" in response.json
         assert response.json["token"] is not None
     
-    def test_register_returns_token(self, auth_client: AuthClient, valid_register_data: dict):
+    def test_register_returns_token(
+        self,
+        auth_client: AuthClient,
+        valid_register_data: Mapping[str, str]
+    ):
         """Test that registration returns a token."""
         response = auth_client.register(**valid_register_data)
         
@@ -37,7 +57,11 @@ class TestRegister:
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_register_returns_user_id(self, auth_client: AuthClient, valid_register_data: dict):
+    def test_register_returns_user_id(
+        self,
+        auth_client: AuthClient,
+        valid_register_data: Mapping[str, str]
+    ):
         """Test that registration returns user ID."""
         response = auth_client.register(**valid_register_data)
         
@@ -86,7 +110,7 @@ class TestRegister:
     def test_register_response_time(
         self,
         auth_client: AuthClient,
-        valid_register_data: dict,
+        valid_register_data: Mapping[str, str],
         assert_performance
     ):
         """Test registration completes within threshold."""
@@ -103,7 +127,7 @@ class TestRegister:
 class TestLogin:
     """Tests for POST /login endpoint."""
     
-    def test_login_successful(self, auth_client: AuthClient, valid_auth_data: dict):
+    def test_login_successful(self, auth_client: AuthClient, valid_auth_data: Mapping[str, str]):
         """Test successful user login."""
         response = auth_client.login(**valid_auth_data)
         
@@ -112,7 +136,7 @@ class TestLogin:
         assert "token" in response.json
         assert response.json["token"] is not None
     
-    def test_login_returns_token(self, auth_client: AuthClient, valid_auth_data: dict):
+    def test_login_returns_token(self, auth_client: AuthClient, valid_auth_data: Mapping[str, str]):
         """Test that login returns authentication token."""
         response = auth_client.login(**valid_auth_data)
         
@@ -122,14 +146,14 @@ class TestLogin:
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_login_token_format(self, auth_client: AuthClient, valid_auth_data: dict):
+    def test_login_token_format(self, auth_client: AuthClient, valid_auth_data: Mapping[str, str]):
         """Test that token has expected format."""
         response = auth_client.login(**valid_auth_data)
         
         assert response.is_success()
         token = response.json["token"]
-        # Token should be alphanumeric
-        assert token.replace("-", "").replace("_", "").isalnum()
+        # Token should be alphanumeric (dashes and underscores allowed)
+        assert _TOKEN_RE.fullmatch(token)
     
     def test_login_without_password(self, auth_client: AuthClient):
         """Test login without password fails."""
@@ -154,7 +178,7 @@ class TestLogin:
     def test_login_with_invalid_credentials(
         self,
         auth_client: AuthClient,
-        invalid_auth_data: dict
+        invalid_auth_data: Mapping[str, str]
     ):
         """Test login with invalid credentials fails."""
         response = auth_client.login(**invalid_auth_data)
@@ -184,7 +208,7 @@ class TestLogin:
     def test_login_response_time(
         self,
         auth_client: AuthClient,
-        valid_auth_data: dict,
+        valid_auth_data: Mapping[str, str],
         assert_performance
     ):
         """Test login completes within threshold."""
@@ -201,33 +225,19 @@ class TestLogin:
 class TestAuthSecurity:
     """Security tests for authentication endpoints."""
     
-    def test_login_with_sql_injection(
-        self,
-        auth_client: AuthClient,
-        sql_injection_payloads: list
-    ):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS[:3])  # Test a few payloads
+    def test_login_with_sql_injection(self, auth_client: AuthClient, payload: str):
         """Test that SQL injection payloads are handled."""
-        for payload in sql_injection_payloads[:3]:  # Test a few payloads
-            response = auth_client.login_unsuccessful(
-                email=payload,
-                password=payload
-            )
-            # Should return error, not crash
-            assert not response.is_success()
+        response = auth_client.login_unsuccessful(email=payload, password=payload)
+        # Should return error, not crash
+        assert not response.is_success()
     
-    def test_login_with_xss_payload(
-        self,
-        auth_client: AuthClient,
-        xss_payloads: list
-    ):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS[:2])  # Test a couple payloads
+    def test_login_with_xss_payload(self, auth_client: AuthClient, payload: str):
         """Test that XSS payloads are handled safely."""
-        for payload in xss_payloads[:2]:  # Test a couple payloads
-            response = auth_client.login_unsuccessful(
-                email=payload,
-                password="test123"
-            )
-            # Should return error, not execute script
-            assert not response.is_success()
+        response = auth_client.login_unsuccessful(email=payload, password="test123")
+        # Should return error, not execute script
+        assert not response.is_success()
     
     def test_register_with_sql_injection(
         self,
@@ -265,17 +275,23 @@ class TestAuthSecurity:
 class TestTokenManagement:
     """Tests for token management and validation."""
     
-    def test_token_is_consistent(self, auth_client: AuthClient, valid_auth_data: dict):
+    async def test_token_is_consistent(
+        self,
+        async_auth_client: AsyncAuthClient,
+        valid_auth_data: Mapping[str, str]
+    ):
         """Test that multiple logins return valid tokens."""
-        response1 = auth_client.login(**valid_auth_data)
-        response2 = auth_client.login(**valid_auth_data)
+        response1, response2 = await asyncio.gather(
+            async_auth_client.login(**valid_auth_data),
+            async_auth_client.login(**valid_auth_data)
+        )
         
         assert response1.is_success()
         assert response2.is_success()
         assert "token" in response1.json
         assert "token" in response2.json
     
-    def test_token_length(self, auth_client: AuthClient, valid_auth_data: dict):
+    def test_token_length(self, auth_client: AuthClient, valid_auth_data: Mapping[str, str]):
         """Test that token has reasonable length."""
         response = auth_client.login(**valid_auth_data)
         
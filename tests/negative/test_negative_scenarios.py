@@ -9,41 +9,40 @@ import pytest
 from clients.users_client import UsersClient
 from clients.resources_client import ResourcesClient
 from clients.auth_client import AuthClient
+from utils.test_data import test_data
+
+# Payloads are parametrized so xdist can spread them across workers
+SQL_INJECTION_PAYLOADS = test_data.generate_sql_injection_payloads()
+XSS_PAYLOADS = test_data.generate_xss_payloads()
+
+# Built once at import rather than in every test that sends it
+LONG_STRING = test_data.generate_long_string(10000)
+
+
+# Replayed from recorded cassettes when run with --record-mode
+pytestmark = [
+    pytest.mark.vcr,
+    pytest.mark.negative,
+    allure.feature("Negative Tests"),
+]
 
 
-@pytest.mark.negative
 @pytest.mark.regression
-@allure.feature("Negative Tests")
 @allure.story("Invalid User Operations")
 class TestInvalidUserOperations:
     """Tests for invalid user operations."""
     
     def test_get_user_with_invalid_id_string(self, users_client: UsersClient):
         """Test getting user with string ID."""
-        try:
-            # This should cause a type error or be handled by API
-            response = users_client.get_user("invalid_id")  # type: ignore
-            # If API handles it, should return 404 or 400
-            assert response.status_code in [400, 404]
-        except (ValueError, TypeError):
-            # Python validation catches it
-            pass
-    
-    def test_get_user_with_negative_id(self, users_client: UsersClient):
-        """Test getting user with negative ID."""
-        try:
-            response = users_client.get_user(-1)
-            assert not response.is_success()
-        except ValueError:
-            pass
-    
-    def test_get_user_with_zero_id(self, users_client: UsersClient):
-        """Test getting user with ID zero."""
-        try:
-            response = users_client.get_user(0)
-            assert not response.is_success()
-        except ValueError:
-            pass
+        # The client formats any ID into the path, so the API must reject it
+        response = users_client.get_user("invalid_id")  # type: ignore
+        assert response.status_code in [400, 404]
+    
+    @pytest.mark.parametrize("user_id", [-1, 0], ids=["negative_id", "zero_id"])
+    def test_get_user_with_nonpositive_id(self, users_client: UsersClient, user_id: int):
+        """Test getting user with a negative or zero ID."""
+        response = users_client.get_user(user_id)
+        assert not response.is_success()
     
     def test_create_user_with_empty_name(self, users_client: UsersClient):
         """Test creating user with empty name."""
@@ -56,6 +55,7 @@ class TestInvalidUserOperations:
         response = users_client.create_user(name="   ", job="   ")
         assert "id" in response.json or response.status_code >= 400
     
+    @pytest.mark.slow
     def test_update_non_existent_user(
         self,
         users_client: UsersClient,
@@ -71,46 +71,46 @@ class TestInvalidUserOperations:
         assert response.status_code in [200, 404]
 
 
-@pytest.mark.negative
 @pytest.mark.regression
-@allure.feature("Negative Tests")
 @allure.story("Boundary Values")
 class TestBoundaryValues:
     """Tests for boundary value conditions."""
     
-    def test_create_user_with_very_long_name(self, users_client: UsersClient):
-        """Test creating user with extremely long name."""
-        long_name = "A" * 10000
-        response = users_client.create_user(name=long_name, job="Tester")
-        # Should either accept or reject with appropriate status
-        assert response.status_code in [200, 201, 400, 413]
-    
-    def test_create_user_with_special_characters(
+    @pytest.mark.parametrize(
+        "name, allowed_status",
+        [
+            pytest.param(
+                LONG_STRING,
+                {200, 201, 400, 413},
+                id="very_long_name",
+                marks=pytest.mark.slow
+            ),
+            pytest.param("!@#$%^&*()", {200, 201, 400}, id="special_characters"),
+        ]
+    )
+    def test_create_user_with_boundary_name(
         self,
         users_client: UsersClient,
-        boundary_values: dict
+        name: str,
+        allowed_status: set
     ):
-        """Test creating user with special characters."""
-        special_name = "!@#$%^&*()"
-        response = users_client.create_user(name=special_name, job="Tester")
-        assert response.status_code in [200, 201, 400]
-    
-    def test_get_users_with_zero_per_page(self, users_client: UsersClient):
-        """Test getting users with per_page=0."""
-        try:
-            response = users_client.get_users(per_page=0)
-            # Should handle gracefully
-            assert response.status_code in [200, 400]
-        except ValueError:
-            pass
+        """Test creating user with boundary name values."""
+        response = users_client.create_user(name=name, job="Tester")
+        # Should either accept or reject with appropriate status
+        assert response.status_code in allowed_status
     
-    def test_get_users_with_negative_page(self, users_client: UsersClient):
-        """Test getting users with negative page number."""
-        try:
-            response = users_client.get_users(page=-1)
-            assert response.status_code in [200, 400]
-        except ValueError:
-            pass
+    @pytest.mark.parametrize(
+        "params",
+        [
+            pytest.param({"per_page": 0}, id="zero_per_page"),
+            pytest.param({"page": -1}, id="negative_page"),
+        ]
+    )
+    def test_get_users_with_invalid_paging(self, users_client: UsersClient, params: dict):
+        """Test getting users with out-of-range paging parameters."""
+        response = users_client.get_users(**params)
+        # Should handle gracefully
+        assert response.status_code in [200, 400]
     
     def test_get_users_with_huge_page_number(self, users_client: UsersClient):
         """Test getting users with very large page number."""
@@ -120,31 +120,21 @@ class TestBoundaryValues:
         assert "data" in response.json
 
 
-@pytest.mark.negative
 @pytest.mark.security
-@allure.feature("Negative Tests")
 @allure.story("Security Edge Cases")
 class TestSecurityEdgeCases:
     """Tests for security-related edge cases."""
     
-    def test_create_user_with_sql_injection(
-        self,
-        users_client: UsersClient,
-        sql_injection_payloads: list
-    ):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS)
+    def test_create_user_with_sql_injection(self, users_client: UsersClient, payload: str):
         """Test that SQL injection payloads are handled safely."""
-        payload = sql_injection_payloads[0]
         response = users_client.create_user(name=payload, job=payload)
         # Should not crash the system
         assert response.status_code in [200, 201, 400]
     
-    def test_create_user_with_xss_payload(
-        self,
-        users_client: UsersClient,
-        xss_payloads: list
-    ):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_create_user_with_xss_payload(self, users_client: UsersClient, payload: str):
         """Test that XSS payloads are handled safely."""
-        payload = xss_payloads[0]
         response = users_client.create_user(name=payload, job="Tester")
         # Should not execute scripts
         assert response.status_code in [200, 201, 400]
@@ -157,28 +147,20 @@ class TestSecurityEdgeCases:
     
     def test_create_user_with_null_bytes(self, users_client: UsersClient):
         """Test creating user with null bytes."""
-        try:
-            null_name = "Test\\x00User"
-            response = users_client.create_user(name=null_name, job="Tester")
-            assert response.status_code in [200, 201, 400]
-        except ValueError:
-            pass
+        null_name = "Test\\x00User"
+        response = users_client.create_user(name=null_name, job="Tester")
+        assert response.status_code in [200, 201, 400]
 
 
-@pytest.mark.negative
 @pytest.mark.regression
-@allure.feature("Negative Tests")
 @allure.story("Invalid Resource Operations")
 class TestInvalidResourceOperations:
     """Tests for invalid resource operations."""
     
     def test_get_resource_with_invalid_id(self, resources_client: ResourcesClient):
         """Test getting resource with invalid ID."""
-        try:
-            response = resources_client.get_resource("invalid")  # type: ignore
-            assert response.status_code in [400, 404]
-        except (ValueError, TypeError):
-            pass
+        response = resources_client.get_resource("invalid")  # type: ignore
+        assert response.status_code in [400, 404]
     
     def test_create_resource_with_invalid_year(self, resources_client: ResourcesClient):
         """Test creating resource with invalid year."""
@@ -201,6 +183,8 @@ class TestInvalidResourceOperations:
         )
         assert response.status_code in [200, 201, 400]
     
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("resource_mutations")
     def test_delete_resource_twice(self, resources_client: ResourcesClient):
         """Test deleting same resource twice."""
         resource_id = 1
@@ -212,19 +196,17 @@ class TestInvalidResourceOperations:
         assert response2.status_code in [204, 404]
 
 
-@pytest.mark.negative
 @pytest.mark.regression
-@allure.feature("Negative Tests")
 @allure.story("Authentication Edge Cases")
 class TestAuthenticationEdgeCases:
     """Tests for authentication edge cases."""
     
+    @pytest.mark.slow
     def test_login_with_very_long_password(self, auth_client: AuthClient):
         """Test login with extremely long password."""
-        long_password = "A" * 10000
         response = auth_client.login_unsuccessful(
             email="test@test.com",
-            password=long_password
+            password=LONG_STRING
         )
         assert not response.is_success()
         assert response.status_code in [400, 413]
@@ -246,18 +228,14 @@ class TestAuthenticationEdgeCases:
         )
         assert not response.is_success()
     
-    def test_login_with_malformed_email(self, auth_client: AuthClient):
+    @pytest.mark.parametrize(
+        "email",
+        ["notanemail", "@example.com", "user@", "user name@example.com"]
+    )
+    def test_login_with_malformed_email(self, auth_client: AuthClient, email: str):
         """Test login with malformed email format."""
-        malformed_emails = [
-            "notanemail",
-            "@example.com",
-            "user@",
-            "user name@example.com"
-        ]
-        
-        for email in malformed_emails:
-            response = auth_client.login_unsuccessful(
-                email=email,
-                password="test"
-            )
-            assert not response.is_success()
+        response = auth_client.login_unsuccessful(
+            email=email,
+            password="test"
+        )
+        assert not response.is_success()
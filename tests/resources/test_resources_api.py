@@ -3,16 +3,24 @@ Resources API test suite.
 
 Tests cover resource CRUD operations, pagination, schema validation, and error handling.
 """
+from typing import Mapping
+
 import allure
 import pytest
 
+from clients.base_client import APIResponse
 from clients.resources_client import ResourcesClient
 from models.schemas import RESOURCE_SCHEMA, validate_resource_schema
 
+# Replayed from recorded cassettes when run with --record-mode
+pytestmark = [
+    pytest.mark.vcr,
+    pytest.mark.resources,
+    allure.feature("Resources API"),
+]
+
 
-@pytest.mark.resources
 @pytest.mark.smoke
-@allure.feature("Resources API")
 @allure.story("List Resources")
 class TestGetResources:
     """Tests for GET /unknown endpoint - listing resources."""
@@ -32,7 +40,7 @@ class TestGetResources:
         response = resources_client.get_resources(page=2)
         
         assert response.is_success()
-        assert response.json["page"] == 2
+        assert response.jq("/page") == 2
     
     def test_get_resources_with_per_page(self, resources_client: ResourcesClient):
         """Test getting resources with custom per_page."""
@@ -60,15 +68,14 @@ class TestGetResources:
         assert_performance
     ):
         """Test response time is within threshold."""
-        response = resources_client.get_resources()
+        # Uncached GET, so a real round-trip is timed
+        response = resources_client.get(resources_client.endpoint_prefix)
         
         assert response.is_success()
         assert_performance(response.elapsed_time, "GET /unknown")
 
 
-@pytest.mark.resources
 @pytest.mark.smoke
-@allure.feature("Resources API")
 @allure.story("Single Resource")
 class TestGetSingleResource:
     """Tests for GET /unknown/{id} endpoint - getting single resource."""
@@ -86,9 +93,9 @@ class TestGetSingleResource:
         assert "data" in response.json
         assert response.json["data"]["id"] == existing_resource_id
     
-    def test_get_resource_has_required_fields(self, resources_client: ResourcesClient):
+    def test_get_resource_has_required_fields(self, resource_1_response: APIResponse):
         """Test that resource has all required fields."""
-        response = resources_client.get_resource(1)
+        response = resource_1_response
         
         assert response.is_success()
         resource_data = response.json["data"]
@@ -97,18 +104,18 @@ class TestGetSingleResource:
         for field in required_fields:
             assert field in resource_data, f"Missing required field: {field}"
     
-    def test_get_resource_color_format(self, resources_client: ResourcesClient):
+    def test_get_resource_color_format(self, resource_1_response: APIResponse):
         """Test that color field is in hex format."""
-        response = resources_client.get_resource(1)
+        response = resource_1_response
         
         assert response.is_success()
         color = response.json["data"]["color"]
         assert color.startswith("#")
         assert len(color) == 7  # #RRGGBB
     
-    def test_get_resource_year_is_valid(self, resources_client: ResourcesClient):
+    def test_get_resource_year_is_valid(self, resource_1_response: APIResponse):
         """Test that year is a valid value."""
-        response = resources_client.get_resource(1)
+        response = resource_1_response
         
         assert response.is_success()
         year = response.json["data"]["year"]
@@ -128,18 +135,21 @@ class TestGetSingleResource:
     
     def test_get_resource_schema_validation(
         self,
-        resources_client: ResourcesClient,
+        resources_1_and_2: Mapping[int, APIResponse],
         validate_json_schema
     ):
         """Test resource response matches schema."""
-        response = resources_client.get_resource(2)
+        response = resources_1_and_2[2]
         
         assert response.is_success()
         validate_json_schema(response.json["data"], RESOURCE_SCHEMA)
     
-    def test_get_resource_pydantic_validation(self, resources_client: ResourcesClient):
+    def test_get_resource_pydantic_validation(
+        self,
+        resources_1_and_2: Mapping[int, APIResponse]
+    ):
         """Test resource with Pydantic model validation."""
-        response = resources_client.get_resource(2)
+        response = resources_1_and_2[2]
         
         assert response.is_success()
         resource = validate_resource_schema(response.json["data"])
@@ -147,9 +157,7 @@ class TestGetSingleResource:
         assert resource.id > 0
 
 
-@pytest.mark.resources
 @pytest.mark.regression
-@allure.feature("Resources API")
 @allure.story("Create Resource")
 class TestCreateResource:
     """Tests for POST /unknown endpoint - creating resources."""
@@ -194,24 +202,19 @@ class TestCreateResource:
         assert len(created_at) > 0
 
 
-@pytest.mark.resources
 @pytest.mark.regression
-@allure.feature("Resources API")
 @allure.story("Update Resource")
 class TestUpdateResource:
     """Tests for PUT/PATCH /unknown/{id} endpoint - updating resources."""
     
-    def test_update_resource_with_put(self, resources_client: ResourcesClient):
+    def test_update_resource_with_put(
+        self,
+        resources_client: ResourcesClient,
+        update_resource_body: bytes
+    ):
         """Test updating resource with PUT."""
         resource_id = 2
-        update_data = {
-            "name": "Updated Resource",
-            "year": 2024,
-            "color": "#FF5733",
-            "pantone_value": "19-1664"
-        }
-        
-        response = resources_client.update_resource(resource_id, **update_data)
+        response = resources_client.update_resource_raw(resource_id, update_resource_body)
         
         assert response.is_success()
         assert response.status_code == 200
@@ -238,13 +241,12 @@ class TestUpdateResource:
         assert len(updated_at) > 0
 
 
-@pytest.mark.resources
 @pytest.mark.regression
-@allure.feature("Resources API")
 @allure.story("Delete Resource")
 class TestDeleteResource:
     """Tests for DELETE /unknown/{id} endpoint - deleting resources."""
     
+    @pytest.mark.xdist_group("resource_mutations")
     def test_delete_resource_success(self, resources_client: ResourcesClient):
         """Test deleting a resource."""
         resource_id = 2
@@ -253,6 +255,7 @@ class TestDeleteResource:
         assert response.status_code == 204
         assert response.text == ""
     
+    @pytest.mark.slow
     def test_delete_non_existent_resource(
         self,
         resources_client: ResourcesClient,
@@ -274,36 +277,24 @@ class TestDeleteResource:
         assert_performance(response.elapsed_time, "DELETE /unknown")
 
 
-@pytest.mark.resources
 @pytest.mark.regression
-@allure.feature("Resources API")
 @allure.story("Resource Data Integrity")
 class TestResourceDataIntegrity:
     """Tests for resource data integrity and validation."""
     
-    def test_resource_id_is_positive(self, resources_client: ResourcesClient):
-        """Test that resource ID is positive integer."""
-        response = resources_client.get_resource(1)
+    def test_resource_1_data_integrity(self, resource_1_response: APIResponse):
+        """Test that resource ID, name and pantone value are well-formed."""
+        assert resource_1_response.is_success()
+        resource_data = resource_1_response.json["data"]
         
-        assert response.is_success()
-        resource_id = response.json["data"]["id"]
-        assert isinstance(resource_id, int)
-        assert resource_id > 0
-    
-    def test_resource_name_is_not_empty(self, resources_client: ResourcesClient):
-        """Test that resource name is not empty."""
-        response = resources_client.get_resource(1)
+        with allure.step("ID is a positive integer"):
+            assert isinstance(resource_data["id"], int)
+            assert resource_data["id"] > 0
         
-        assert response.is_success()
-        name = response.json["data"]["name"]
-        assert isinstance(name, str)
-        assert len(name) > 0
-    
-    def test_pantone_value_format(self, resources_client: ResourcesClient):
-        """Test that pantone value has expected format."""
-        response = resources_client.get_resource(1)
+        with allure.step("Name is not empty"):
+            assert isinstance(resource_data["name"], str)
+            assert len(resource_data["name"]) > 0
         
-        assert response.is_success()
-        pantone = response.json["data"]["pantone_value"]
-        assert isinstance(pantone, str)
-        assert len(pantone) > 0
+        with allure.step("Pantone value is not empty"):
+            assert isinstance(resource_data["pantone_value"], str)
+            assert len(resource_data["pantone_value"]) > 0
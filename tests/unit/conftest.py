@@ -0,0 +1,30 @@
+"""
+Fixtures for the offline unit tests.
+
+Keeps the unit suite from writing run logs into the working tree.
+"""
+
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from config.settings import settings
+from utils.logger import get_logger
+
+
+@pytest.fixture(scope="session", autouse=True)
+def unit_log_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """
+    Point the global logger at a temporary log directory.
+
+    Clients under test log through the global logger, which would otherwise
+    write into the repo's logs/ directory. The logger is rebuilt here and stays
+    memoized afterwards, so the session-end log lines land in the same place.
+    """
+    log_dir = tmp_path_factory.mktemp("logs")
+    previous = settings.log_dir
+    settings.log_dir = str(log_dir)
+    get_logger.cache_clear()
+    yield log_dir
+    settings.log_dir = previous
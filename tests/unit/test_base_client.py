@@ -0,0 +1,150 @@
+"""
+Base client test suite.
+
+Tests cover the retry policy and JSON Pointer lookups of APIResponse.
+"""
+
+from types import SimpleNamespace
+from typing import Iterator, List, Union
+
+import allure
+import orjson
+import pytest
+import requests
+from tenacity import Retrying, wait_none
+
+from clients import base_client
+from clients.base_client import RETRY_STATUS_CODES, APIResponse, retry_policy
+from config.settings import settings
+
+BODY = {
+    "data": [{"id": 1, "name": "cerulean", "a/b": "slash", "m~n": "tilde"}],
+    "support": {"url": "https://reqres.in"},
+}
+
+
+def _retrying() -> Retrying:
+    """Build the client's retry policy without backoff sleeps."""
+    return Retrying(**{**retry_policy(), "wait": wait_none()})
+
+
+def _responses(*status_codes: int) -> Iterator[SimpleNamespace]:
+    return (SimpleNamespace(status_code=status_code) for status_code in status_codes)
+
+
+def _response(body: bytes) -> APIResponse:
+    raw = requests.Response()
+    raw.status_code = 200
+    raw._content = body
+    return APIResponse(raw, 0.0)
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Retry Policy")
+class TestRetryPolicy:
+    """Tests for retry_policy."""
+
+    @pytest.mark.parametrize("status_code", sorted(RETRY_STATUS_CODES))
+    def test_transient_status_is_retried(self, status_code: int):
+        """Test throttling and gateway errors are retried until a response succeeds."""
+        responses = _responses(status_code, 200)
+
+        response = _retrying()(lambda: next(responses))
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("status_code", [200, 201, 204, 400, 401, 404, 500])
+    def test_other_status_is_returned_immediately(self, status_code: int):
+        """Test success and non-transient error responses are not retried."""
+        responses = _responses(status_code, 200)
+
+        response = _retrying()(lambda: next(responses))
+
+        assert response.status_code == status_code
+
+    def test_last_response_is_returned_when_attempts_run_out(self):
+        """Test a response that stays transient is returned after the last attempt."""
+        calls: List[int] = []
+
+        def send() -> SimpleNamespace:
+            calls.append(1)
+            return SimpleNamespace(status_code=503)
+
+        response = _retrying()(send)
+
+        assert response.status_code == 503
+        assert len(calls) == settings.api_retry_count + 1
+
+    def test_transport_error_is_retried(self):
+        """Test connection errors are retried."""
+        outcomes: Iterator[Union[Exception, SimpleNamespace]] = iter(
+            [requests.ConnectionError("reset"), SimpleNamespace(status_code=200)]
+        )
+
+        def send() -> SimpleNamespace:
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert _retrying()(send).status_code == 200
+
+    def test_persistent_transport_error_is_reraised(self):
+        """Test the transport error itself is raised once attempts run out."""
+
+        def send() -> SimpleNamespace:
+            raise requests.Timeout("slow")
+
+        with pytest.raises(requests.Timeout):
+            _retrying()(send)
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("JSON Pointer")
+class TestJsonPointer:
+    """Tests for APIResponse.jq, with and without simdjson."""
+
+    @pytest.fixture(params=["simdjson", "json"], autouse=True)
+    def parser(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Run each lookup through simdjson and through the parsed-JSON fallback."""
+        if request.param == "json":
+            monkeypatch.setattr(base_client, "simdjson", None)
+
+    @pytest.mark.parametrize(
+        "pointer, expected",
+        [
+            ("/data/0/id", 1),
+            ("/data/0/name", "cerulean"),
+            ("/data/0/a~1b", "slash"),
+            ("/data/0/m~0n", "tilde"),
+            ("/support", {"url": "https://reqres.in"}),
+            ("/data", BODY["data"]),
+            ("", BODY),
+        ],
+    )
+    def test_pointer_resolves_value(self, pointer: str, expected):
+        """Test pointers resolve to plain Python values."""
+        assert _response(orjson.dumps(BODY)).jq(pointer) == expected
+
+    def test_missing_member_raises_key_error(self):
+        """Test a missing object member raises KeyError."""
+        with pytest.raises(KeyError):
+            _response(orjson.dumps(BODY)).jq("/data/0/missing")
+
+    def test_out_of_range_index_raises_index_error(self):
+        """Test an array index past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            _response(orjson.dumps(BODY)).jq("/data/5")
+
+    def test_scalar_document_falls_back_to_json(self):
+        """Test scalar documents resolve the root pointer without simdjson errors."""
+        assert _response(b"5").jq("") == 5
+
+    def test_already_parsed_body_is_used(self):
+        """Test lookups after json was accessed use the parsed body."""
+        response = _response(orjson.dumps(BODY))
+        response.json["data"][0]["id"] = 2
+
+        assert response.jq("/data/0/id") == 2
@@ -0,0 +1,87 @@
+"""
+Test data generator test suite.
+
+Tests cover the bulk record generators of TestDataGenerator.
+"""
+
+import re
+from itertools import islice
+from types import GeneratorType
+from typing import Any, Dict, List
+
+import allure
+import orjson
+import pytest
+from faker import Faker
+
+from utils.test_data import SEED, _text, test_data
+
+USER_KEYS = {"name", "job", "email"}
+RESOURCE_KEYS = {"name", "year", "color", "pantone_value"}
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Test Data")
+class TestBulkUsers:
+    """Tests for the bulk user generators."""
+
+    def test_json_bodies_decode_to_user_records(self):
+        """Test each pre-encoded body decodes to a bulk user record."""
+        bodies = test_data.generate_bulk_users_json(5)
+
+        assert len(bodies) == 5
+        for body in bodies:
+            assert isinstance(body, bytes)
+            user = orjson.loads(body)
+            assert set(user) == USER_KEYS
+            assert all(isinstance(value, str) and value for value in user.values())
+
+    def test_json_bodies_match_the_dict_form(self):
+        """Test pre-encoded bodies have the same fields as generate_bulk_users records."""
+        (user,) = test_data.generate_bulk_users(1)
+        (body,) = test_data.generate_bulk_users_json(1)
+
+        assert set(orjson.loads(body)) == set(user)
+
+    def test_iter_yields_count_records(self):
+        """Test iter_bulk_users yields exactly count user records."""
+        users = list(test_data.iter_bulk_users(7))
+
+        assert len(users) == 7
+        assert all(set(user) == USER_KEYS for user in users)
+
+    def test_iter_is_lazy(self):
+        """Test iter_bulk_users only generates the records that are consumed."""
+        users = test_data.iter_bulk_users(10**9)
+
+        assert isinstance(users, GeneratorType)
+        assert len(list(islice(users, 3))) == 3
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Test Data")
+class TestBulkResources:
+    """Tests for generate_bulk_resources."""
+
+    @staticmethod
+    def _seeded_batch(count: int) -> List[Dict[str, Any]]:
+        """Reseed Faker and the mimesis text provider, then generate a batch."""
+        Faker.seed(SEED)
+        _text.reseed(SEED)
+        return test_data.generate_bulk_resources(count)
+
+    def test_output_is_reproducible_for_a_seed(self):
+        """Test the same seed gives the same resources, numbers included."""
+        assert self._seeded_batch(5) == self._seeded_batch(5)
+
+    def test_records_have_resource_fields(self):
+        """Test each record has the resource keys and well-formed values."""
+        resources = self._seeded_batch(5)
+
+        assert len(resources) == 5
+        for resource in resources:
+            assert set(resource) == RESOURCE_KEYS
+            assert re.fullmatch(r"#[0-9a-f]{6}", resource["color"])
+            assert re.fullmatch(r"\d{2}-\d{4}", resource["pantone_value"])
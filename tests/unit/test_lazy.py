@@ -0,0 +1,69 @@
+"""
+Lazy proxy test suite.
+
+Tests cover deferred construction and attribute forwarding of LazyProxy.
+"""
+
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import List
+
+import allure
+import pytest
+
+from utils.lazy import LazyProxy
+
+
+@pytest.fixture
+def built() -> List[SimpleNamespace]:
+    """Collect the objects built by the proxy factory."""
+    return []
+
+
+@pytest.fixture
+def proxy(built: List[SimpleNamespace]) -> LazyProxy:
+    """Provide a proxy over a memoized factory recording what it builds."""
+
+    @lru_cache(maxsize=None)
+    def factory() -> SimpleNamespace:
+        target = SimpleNamespace(name="target")
+        built.append(target)
+        return target
+
+    return LazyProxy(factory)
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Lazy Proxy")
+class TestLazyProxy:
+    """Tests for LazyProxy."""
+
+    def test_target_is_built_on_first_use(self, proxy: LazyProxy, built: List[SimpleNamespace]):
+        """Test the factory is not called until an attribute is accessed."""
+        assert built == []
+
+        assert proxy.name == "target"
+        assert proxy.name == "target"
+        assert len(built) == 1
+
+    def test_setattr_and_delattr_are_forwarded(
+        self, proxy: LazyProxy, built: List[SimpleNamespace]
+    ):
+        """Test attribute writes and deletes reach the target."""
+        proxy.level = "DEBUG"
+
+        assert built[0].level == "DEBUG"
+
+        del proxy.level
+
+        assert not hasattr(built[0], "level")
+
+    def test_missing_attribute_raises_attribute_error(self, proxy: LazyProxy):
+        """Test lookups of missing attributes fail like on the target."""
+        with pytest.raises(AttributeError):
+            proxy.missing
+
+    def test_repr_is_the_target_repr(self, proxy: LazyProxy):
+        """Test repr shows the proxied object."""
+        assert repr(proxy) == "namespace(name='target')"
@@ -0,0 +1,65 @@
+"""
+Logger test suite.
+
+Tests cover masking of sensitive values in logged request bodies.
+"""
+
+import allure
+import orjson
+import pytest
+
+from utils.logger import APILogger
+
+REDACTED = "***REDACTED***"
+
+
+@pytest.fixture(scope="module")
+def api_logger() -> APILogger:
+    """Provide a console-only logger."""
+    return APILogger(name="API-Tests-Unit", log_to_file=False)
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Log Sanitization")
+class TestSanitizeBody:
+    """Tests for APILogger._sanitize_body."""
+
+    def test_mapping_body_is_masked(self, api_logger: APILogger):
+        """Test sensitive keys of a mapping body are masked."""
+        sanitized = api_logger._sanitize_body({"email": "a@b.c", "password": "hunter2"})
+
+        assert sanitized == {"email": "a@b.c", "password": REDACTED}
+
+    def test_encoded_json_body_is_masked(self, api_logger: APILogger):
+        """Test pre-encoded JSON bytes are decoded and masked."""
+        sanitized = api_logger._sanitize_body(orjson.dumps({"token": "abc", "year": 2024}))
+
+        assert sanitized == {"token": REDACTED, "year": 2024}
+
+    def test_json_string_body_is_masked(self, api_logger: APILogger):
+        """Test JSON text bodies are decoded and masked."""
+        sanitized = api_logger._sanitize_body('{"api_key": "k", "name": "x"}')
+
+        assert sanitized == {"api_key": REDACTED, "name": "x"}
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "email=a%40b.c&password=hunter2",
+            b"password=hunter2",
+            orjson.dumps([{"password": "hunter2"}]),
+        ],
+    )
+    def test_unmaskable_body_is_replaced_by_its_size(self, api_logger: APILogger, body):
+        """Test raw bodies that can't be masked are logged as a size only."""
+        sanitized = api_logger._sanitize_body(body)
+
+        assert "hunter2" not in str(sanitized)
+        assert sanitized == f"<{len(body)} bytes>"
+
+    def test_body_without_sensitive_keys_is_not_copied(self, api_logger: APILogger):
+        """Test mappings without sensitive keys are logged as they are."""
+        body = {"name": "morpheus", "job": "leader"}
+
+        assert api_logger._sanitize_body(body) is body
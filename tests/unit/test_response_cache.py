@@ -0,0 +1,201 @@
+"""
+Response cache test suite.
+
+Tests cover the LRU response cache and how BaseClient.get uses it.
+"""
+
+from typing import Any, Callable, Dict, Generator, List, Tuple
+
+import allure
+import orjson
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from clients.base_client import BaseClient
+from config.settings import settings
+from utils.response_cache import ResponseCache, response_cache
+
+BASE_URL = "http://unit.test/api"
+
+# (status code, JSON body, response headers)
+CannedResponse = Tuple[int, Dict[str, Any], Dict[str, str]]
+
+
+class CannedAdapter(HTTPAdapter):
+    """Transport adapter answering every request from a handler instead of the network."""
+
+    def __init__(self, handler: Callable[[requests.PreparedRequest], CannedResponse]):
+        super().__init__()
+        self.handler = handler
+        self.sent: List[requests.PreparedRequest] = []
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        self.sent.append(request)
+        status_code, body, headers = self.handler(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = orjson.dumps(body)
+        response.headers.update(headers)
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+
+def _ok(request: requests.PreparedRequest) -> CannedResponse:
+    return 200, {"data": {"id": 1, "name": "cerulean"}}, {"Content-Type": "application/json"}
+
+
+def _no_store(request: requests.PreparedRequest) -> CannedResponse:
+    return 200, {"data": {"id": 1}}, {"Cache-Control": "private, no-store"}
+
+
+@pytest.fixture
+def cached_client(monkeypatch: pytest.MonkeyPatch) -> Generator[BaseClient, None, None]:
+    """Provide a client on a canned transport with the response cache enabled."""
+    monkeypatch.setattr(settings, "enable_response_cache", True)
+    session = requests.Session()
+    session.mount("http://", CannedAdapter(_ok))
+    yield BaseClient(base_url=BASE_URL, session=session)
+    response_cache.invalidate("http://unit.test")
+
+
+def _adapter(client: BaseClient) -> CannedAdapter:
+    adapter = client.session.get_adapter(BASE_URL)
+    assert isinstance(adapter, CannedAdapter)
+    return adapter
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Response Cache")
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the entry evicted when full is the least recently used one."""
+        cache = ResponseCache(maxsize=2)
+        first, second, third = (cache.make_key(f"{BASE_URL}/users/{i}") for i in (1, 2, 3))
+        cache.set(first, "first")
+        cache.set(second, "second")
+
+        cache.get(first)
+        cache.set(third, "third")
+
+        assert cache.get(first) == "first"
+        assert cache.get(second) is None
+        assert cache.get(third) == "third"
+        assert len(cache) == 2
+
+    def test_hits_and_misses_are_counted(self):
+        """Test lookups update the hit/miss statistics and clear resets them."""
+        cache = ResponseCache()
+        key = cache.make_key(f"{BASE_URL}/users")
+        cache.get(key)
+        cache.set(key, "users")
+        cache.get(key)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        cache.clear()
+
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    def test_key_ignores_parameter_and_header_order(self):
+        """Test keys are built from sorted parameters and headers."""
+        make_key = ResponseCache.make_key
+
+        assert make_key(BASE_URL, {"page": 2, "per_page": 6}, {"A": "1", "B": "2"}) == make_key(
+            BASE_URL, {"per_page": 6, "page": 2}, {"B": "2", "A": "1"}
+        )
+
+    def test_key_depends_on_headers(self):
+        """Test responses fetched with different headers get different keys."""
+        make_key = ResponseCache.make_key
+
+        assert make_key(BASE_URL) != make_key(BASE_URL, headers={"Authorization": "Bearer t"})
+
+    def test_invalidate_evicts_collection_and_members_only(self):
+        """Test invalidation by prefix evicts a collection and its members, not siblings."""
+        cache = ResponseCache()
+        urls = [
+            f"{BASE_URL}/users",
+            f"{BASE_URL}/users/2",
+            f"{BASE_URL}/users2",
+            f"{BASE_URL}/unknown/1",
+        ]
+        for url in urls:
+            cache.set(cache.make_key(url), url)
+
+        evicted = cache.invalidate(f"{BASE_URL}/users")
+
+        assert evicted == 2
+        assert [url for url in urls if cache.get(cache.make_key(url))] == urls[2:]
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Response Cache")
+class TestCachedGet:
+    """Tests for cacheable GETs in BaseClient."""
+
+    def test_hit_is_served_without_a_request(self, cached_client: BaseClient):
+        """Test a repeated cacheable GET is answered from the cache."""
+        first = cached_client.get("unknown/1", cacheable=True)
+        second = cached_client.get("unknown/1", cacheable=True)
+
+        assert len(_adapter(cached_client).sent) == 1
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.json == first.json
+
+    def test_hit_json_is_independent_of_other_hits(self, cached_client: BaseClient):
+        """Test mutating one hit's JSON body leaves later hits unchanged."""
+        assert cached_client.get("unknown/1", cacheable=True).json["data"]["name"] == "cerulean"
+
+        cached_client.get("unknown/1", cacheable=True).json["data"]["name"] = "mutated"
+
+        assert cached_client.get("unknown/1", cacheable=True).json["data"]["name"] == "cerulean"
+
+    def test_no_store_response_is_not_cached(self, cached_client: BaseClient):
+        """Test responses marked Cache-Control: no-store are always refetched."""
+        _adapter(cached_client).handler = _no_store
+
+        cached_client.get("unknown/1", cacheable=True)
+        response = cached_client.get("unknown/1", cacheable=True)
+
+        assert len(_adapter(cached_client).sent) == 2
+        assert not response.from_cache
+
+    def test_auth_token_change_misses_the_cache(self, cached_client: BaseClient):
+        """Test responses cached without a token are not served to an authenticated client."""
+        cached_client.get("unknown/1", cacheable=True)
+
+        cached_client.set_auth_token("token")
+        response = cached_client.get("unknown/1", cacheable=True)
+
+        assert len(_adapter(cached_client).sent) == 2
+        assert not response.from_cache
+
+    @pytest.mark.parametrize(
+        "method, endpoint",
+        [
+            ("POST", "unknown"),
+            ("PUT", "unknown/1"),
+            ("PATCH", "unknown/1"),
+            ("DELETE", "unknown/1"),
+        ],
+    )
+    def test_mutating_request_invalidates_collection(
+        self, cached_client: BaseClient, method: str, endpoint: str
+    ):
+        """Test mutating requests evict cached GETs of their collection."""
+        cached_client.get("unknown", cacheable=True)
+        cached_client.get("unknown/1", cacheable=True)
+
+        cached_client.request(method, endpoint)
+
+        assert not cached_client.get("unknown", cacheable=True).from_cache
+        assert not cached_client.get("unknown/1", cacheable=True).from_cache
@@ -0,0 +1,60 @@
+"""
+Schema cache test suite.
+
+Tests cover compiling, caching and the jsonschema fallback of schema validators.
+"""
+
+import allure
+import fastjsonschema
+import jsonschema
+import pytest
+
+from utils import schema_cache
+from utils.schema_cache import get_validator
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Schema Cache")
+class TestGetValidator:
+    """Tests for get_validator."""
+
+    def test_validator_is_compiled_once_per_schema(self):
+        """Test the same schema object gets the same compiled validator."""
+        schema = {"type": "object", "required": ["id"]}
+
+        assert get_validator(schema) is get_validator(schema)
+
+    def test_equal_schemas_are_cached_by_identity(self):
+        """Test distinct schema objects get their own validators."""
+        schema = {"type": "integer"}
+
+        assert get_validator(schema) is not get_validator(dict(schema))
+
+    def test_reused_id_does_not_return_stale_validator(self, monkeypatch: pytest.MonkeyPatch):
+        """Test an entry left by another schema under the same id is not reused."""
+        schema = {"type": "integer"}
+        stale = {"type": "string"}
+        monkeypatch.setitem(schema_cache._validators, id(schema), (stale, get_validator(stale)))
+
+        validate = get_validator(schema)
+
+        validate(1)
+        with pytest.raises(fastjsonschema.JsonSchemaValueException):
+            validate("1")
+
+    def test_invalid_data_raises(self):
+        """Test compiled validators raise on data not matching the schema."""
+        validate = get_validator({"type": "object", "required": ["id"]})
+
+        validate({"id": 1})
+        with pytest.raises(fastjsonschema.JsonSchemaValueException):
+            validate({})
+
+    def test_falls_back_to_jsonschema(self):
+        """Test schemas fastjsonschema cannot compile are validated with jsonschema."""
+        validate = get_validator({"type": "string", "format": "not-a-known-format"})
+
+        validate("anything")
+        with pytest.raises(jsonschema.ValidationError):
+            validate(1)
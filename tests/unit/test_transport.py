@@ -0,0 +1,48 @@
+"""
+Transport test suite.
+
+Tests cover which TLS contexts the requests and aiohttp transports use.
+"""
+
+import allure
+import pytest
+from requests.adapters import HTTPAdapter
+
+from clients._transport import AIOHTTP_SSL_CONTEXT, REQUESTS_SSL_CONTEXT, SharedTLSAdapter
+from clients.base_client import BaseClient
+
+
+@pytest.mark.unit
+@allure.feature("Framework Utilities")
+@allure.story("Transport")
+class TestSharedTLSAdapter:
+    """Tests for SharedTLSAdapter and session creation."""
+
+    def test_transports_do_not_share_a_context(self):
+        """Test urllib3 and aiohttp each get their own TLS context."""
+        assert REQUESTS_SSL_CONTEXT is not AIOHTTP_SSL_CONTEXT
+
+    def test_pools_use_requests_context(self):
+        """Test the pool manager hands the requests context to new pools."""
+        adapter = SharedTLSAdapter()
+
+        pool = adapter.poolmanager.connection_from_url("https://example.com")
+
+        assert pool.conn_kw["ssl_context"] is REQUESTS_SSL_CONTEXT
+
+    def test_proxy_managers_use_requests_context(self):
+        """Test proxy managers hand the requests context to new pools."""
+        adapter = SharedTLSAdapter()
+
+        manager = adapter.proxy_manager_for("http://proxy.example.com:3128")
+
+        assert manager.connection_pool_kw["ssl_context"] is REQUESTS_SSL_CONTEXT
+
+    def test_unverified_session_uses_plain_adapter(self):
+        """Test sessions that skip verification never touch the shared context."""
+        session = BaseClient.create_session(verify_ssl=False)
+
+        adapter = session.get_adapter("https://example.com")
+
+        assert type(adapter) is HTTPAdapter
+        assert "ssl_context" not in adapter.poolmanager.connection_pool_kw
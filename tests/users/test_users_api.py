@@ -3,10 +3,13 @@ Users API test suite.
 
 Tests cover all CRUD operations, pagination, schema validation, and error handling.
 """
+from typing import Mapping
+
 import allure
 import pytest
 from pydantic import ValidationError
 
+from clients.base_client import APIResponse
 from clients.users_client import UsersClient
 from models.schemas import (
     USER_SCHEMA,
@@ -66,7 +69,8 @@ class TestGetUsers:
     
     def test_get_users_response_time(self, users_client: UsersClient, assert_performance):
         """Test that getting users completes within performance threshold."""
-        response = users_client.get_users()
+        # Uncached GET, so a real round-trip is timed
+        response = users_client.get(users_client.endpoint_prefix)
         
         assert response.is_success()
         assert_performance(response.elapsed_time, "GET /users")
@@ -110,9 +114,9 @@ class TestGetSingleUser:
         assert "data" in response.json
         assert response.json["data"]["id"] == existing_user_id
     
-    def test_get_user_has_required_fields(self, users_client: UsersClient):
+    def test_get_user_has_required_fields(self, user_1_response: APIResponse):
         """Test that user response contains all required fields."""
-        response = users_client.get_user(1)
+        response = user_1_response
         
         assert response.is_success()
         user_data = response.json["data"]
@@ -121,22 +125,22 @@ class TestGetSingleUser:
         for field in required_fields:
             assert field in user_data, f"Missing required field: {field}"
     
-    def test_get_user_email_format(self, users_client: UsersClient):
-        """Test that user email is in valid format."""
-        response = users_client.get_user(1)
-        
-        assert response.is_success()
-        email = response.json["data"]["email"]
-        assert "@" in email
-        assert "." in email
-    
-    def test_get_user_avatar_is_url(self, users_client: UsersClient):
-        """Test that avatar field is a valid URL."""
-        response = users_client.get_user(1)
-        
-        assert response.is_success()
-        avatar = response.json["data"]["avatar"]
-        assert avatar.startswith("http://") or avatar.startswith("https://")
+    @pytest.mark.parametrize(
+        "field, check",
+        [
+            pytest.param("email", lambda v: "@" in v and "." in v, id="email_format"),
+            pytest.param(
+                "avatar",
+                lambda v: v.startswith(("http://", "https://")),
+                id="avatar_is_url"
+            ),
+        ]
+    )
+    def test_get_user_field_format(self, user_1_response: APIResponse, field: str, check):
+        """Test that user fields are in the expected format."""
+        assert user_1_response.is_success()
+        value = user_1_response.json["data"][field]
+        assert check(value), f"Unexpected {field} format: {value}"
     
     def test_get_non_existent_user(self, users_client: UsersClient, non_existent_user_id: int):
         """Test getting a non-existent user returns 404."""
@@ -147,11 +151,11 @@ class TestGetSingleUser:
     
     def test_get_user_schema_validation(
         self,
-        users_client: UsersClient,
+        user_1_response: APIResponse,
         validate_json_schema
     ):
         """Test that single user response matches schema."""
-        response = users_client.get_user(1)
+        response = user_1_response
         
         assert response.is_success()
         validate_json_schema(response.json["data"], USER_SCHEMA)
@@ -173,7 +177,7 @@ class TestGetSingleUser:
 class TestCreateUser:
     """Tests for POST /users endpoint - creating users."""
     
-    def test_create_user_success(self, users_client: UsersClient, user_data: dict):
+    def test_create_user_success(self, users_client: UsersClient, user_data: Mapping[str, str]):
         """Test creating a new user with valid data."""
         response = users_client.create_user(**user_data)
         
@@ -195,7 +199,7 @@ class TestCreateUser:
         assert response.is_success()
         assert "id" in response.json
     
-    def test_create_user_returns_id(self, users_client: UsersClient, user_data: dict):
+    def test_create_user_returns_id(self, users_client: UsersClient, user_data: Mapping[str, str]):
         """Test that created user has an ID."""
         response = users_client.create_user(**user_data)
         
@@ -203,7 +207,11 @@ class TestCreateUser:
         assert "id" in response.json
         assert response.json["id"] is not None
     
-    def test_create_user_timestamp_format(self, users_client: UsersClient, user_data: dict):
+    def test_create_user_timestamp_format(
+        self,
+        users_client: UsersClient,
+        user_data: Mapping[str, str]
+    ):
         """Test that createdAt timestamp is in ISO 8601 format."""
         response = users_client.create_user(**user_data)
         
@@ -215,7 +223,7 @@ class TestCreateUser:
     def test_create_user_response_time(
         self,
         users_client: UsersClient,
-        user_data: dict,
+        user_data: Mapping[str, str],
         assert_performance
     ):
         """Test that user creation completes within threshold."""
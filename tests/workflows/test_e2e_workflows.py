@@ -3,6 +3,8 @@ End-to-end workflow tests.
 
 Tests cover complete user journeys and multi-step operations.
 """
+from typing import Mapping, Tuple
+
 import allure
 import pytest
 
@@ -17,7 +19,11 @@ from clients.users_client import UsersClient
 class TestUserLifecycleWorkflow:
     """Tests for complete user lifecycle: create -> update -> delete."""
     
-    def test_create_update_delete_user_workflow(self, users_client: UsersClient, user_data: dict):
+    def test_create_update_delete_user_workflow(
+        self,
+        users_client: UsersClient,
+        user_data: Mapping[str, str]
+    ):
         """Test complete user lifecycle workflow."""
         # Step 1: Create user
         create_response = users_client.create_user(**user_data)
@@ -34,7 +40,11 @@ class TestUserLifecycleWorkflow:
         delete_response = users_client.delete_user(int(user_id))
         assert delete_response.status_code == 204
     
-    def test_create_patch_delete_workflow(self, users_client: UsersClient, user_data: dict):
+    def test_create_patch_delete_workflow(
+        self,
+        users_client: UsersClient,
+        user_data: Mapping[str, str]
+    ):
         """Test workflow with PATCH update."""
         # Create
         create_response = users_client.create_user(**user_data)
@@ -49,21 +59,20 @@ class TestUserLifecycleWorkflow:
         delete_response = users_client.delete_user(user_id)
         assert delete_response.status_code == 204
     
-    def test_multiple_users_creation_workflow(
+    def test_bulk_users_creation_workflow(
         self,
-        users_client: UsersClient,
-        bulk_users_data: list
+        bulk_users_data: Tuple[Mapping[str, str], ...],
+        bulk_users_created: list
     ):
-        """Test creating multiple users in sequence."""
-        created_ids = []
+        """Test creating multiple users concurrently."""
+        assert len(bulk_users_created) == len(bulk_users_data)
         
-        for user_data in bulk_users_data[:5]:  # Create 5 users
-            response = users_client.create_user(**user_data)
+        for user_data, response in zip(bulk_users_data, bulk_users_created):
             assert response.is_success()
-            created_ids.append(response.json["id"])
+            assert response.json["name"] == user_data["name"]
         
-        assert len(created_ids) == 5
-        assert len(set(created_ids)) == 5  # All IDs are unique
+        created_ids = [response.json["id"] for response in bulk_users_created]
+        assert len(set(created_ids)) == len(created_ids)  # All IDs are unique
 
 
 @pytest.mark.workflows
@@ -76,7 +85,7 @@ class TestAuthenticationWorkflow:
     def test_register_then_login_workflow(
         self,
         auth_client: AuthClient,
-        valid_register_data: dict
+        valid_register_data: Mapping[str, str]
     ):
         """Test registering and then logging in."""
         # Register
@@ -89,7 +98,11 @@ class TestAuthenticationWorkflow:
         assert login_response.is_success()
         assert "token" in login_response.json
     
-    def test_failed_login_retry_workflow(self, auth_client: AuthClient, valid_auth_data: dict):
+    def test_failed_login_retry_workflow(
+        self,
+        auth_client: AuthClient,
+        valid_auth_data: Mapping[str, str]
+    ):
         """Test failing login then succeeding."""
         # Fail with wrong credentials
         fail_response = auth_client.login_unsuccessful(email="wrong@test.com")
@@ -99,7 +112,11 @@ class TestAuthenticationWorkflow:
         success_response = auth_client.login(**valid_auth_data)
         assert success_response.is_success()
     
-    def test_multiple_login_sessions(self, auth_client: AuthClient, valid_auth_data: dict):
+    def test_multiple_login_sessions(
+        self,
+        auth_client: AuthClient,
+        valid_auth_data: Mapping[str, str]
+    ):
         """Test multiple concurrent login sessions."""
         tokens = []
         
@@ -120,23 +137,17 @@ class TestDataRetrievalWorkflow:
     
     def test_pagination_workflow(self, users_client: UsersClient):
         """Test paginating through all users."""
-        page = 1
-        all_users = []
+        first_page = users_client.get_users(page=1)
+        assert first_page.is_success()
         
-        while True:
-            response = users_client.get_users(page=page)
+        # The first page tells how many remain; fetch those concurrently
+        total_pages = first_page.json["total_pages"]
+        responses = [first_page, *users_client.get_users_pages(range(2, total_pages + 1))]
+        
+        all_users = []
+        for response in responses:
             assert response.is_success()
-            
-            users = response.json["data"]
-            if not users:
-                break
-            
-            all_users.extend(users)
-            
-            if page >= response.json["total_pages"]:
-                break
-            
-            page += 1
+            all_users.extend(response.json["data"])
         
         assert len(all_users) > 0
     
@@ -145,8 +156,7 @@ class TestDataRetrievalWorkflow:
         user_ids = [1, 2, 3]
         users = []
         
-        for user_id in user_ids:
-            response = users_client.get_user(user_id)
+        for response in users_client.get_users_bulk(user_ids):
             assert response.is_success()
             users.append(response.json["data"])
         
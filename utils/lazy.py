@@ -0,0 +1,39 @@
+"""
+Lazy object proxy for deferring expensive module-level singletons.
+
+Lets modules keep exposing a global instance while constructing it on first use.
+"""
+
+from typing import Any, Callable
+
+
+class LazyProxy:
+    """
+    Proxy that forwards attribute access to an object built on first use.
+
+    The factory is expected to memoize its result (e.g. with functools.lru_cache),
+    so every access after the first resolves to the same instance.
+    """
+
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Initialize the proxy.
+
+        Args:
+            factory: Zero-argument callable returning the proxied object
+        """
+        object.__setattr__(self, "_factory", factory)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._factory(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._factory(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._factory(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._factory())
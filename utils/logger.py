@@ -3,13 +3,29 @@ Custom logging configuration for API test automation framework.
 
 Provides colored console output and structured file logging with request/response sanitization.
 """
+import atexit
 import logging
+import os
+import queue
+import re
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import colorlog
+import orjson
+
+from config.settings import settings
+from utils.lazy import LazyProxy
+
+# Keys whose values are masked in logged headers and bodies
+_SENSITIVE_KEY_RE = re.compile(r"password|token|api_key|secret|authorization", re.IGNORECASE)
+
+# Separator framing test start/end entries
+_SEP = "=" * 80
 
 
 class APILogger:
@@ -37,21 +53,27 @@ class APILogger:
         self.logger.setLevel(getattr(logging, level.upper()))
         self.logger.handlers = []  # Clear existing handlers
         
-        # Console handler with colors
-        console_handler = colorlog.StreamHandler(sys.stdout)
+        # Console handler, colored only when stdout is a terminal
+        if sys.stdout.isatty():
+            console_handler = colorlog.StreamHandler(sys.stdout)
+            console_format: logging.Formatter = colorlog.ColoredFormatter(
+                "%(log_color)s%(asctime)s [%(levelname)8s] %(name)s - %(message)s%(reset)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+                log_colors={
+                    "DEBUG": "cyan",
+                    "INFO": "green",
+                    "WARNING": "yellow",
+                    "ERROR": "red",
+                    "CRITICAL": "red,bg_white",
+                }
+            )
+        else:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_format = logging.Formatter(
+                "%(asctime)s [%(levelname)8s] %(name)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
         console_handler.setLevel(logging.DEBUG)
-        
-        console_format = colorlog.ColoredFormatter(
-            "%(log_color)s%(asctime)s [%(levelname)8s] %(name)s - %(message)s%(reset)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            log_colors={
-                "DEBUG": "cyan",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "red,bg_white",
-            }
-        )
         console_handler.setFormatter(console_format)
         self.logger.addHandler(console_handler)
         
@@ -60,10 +82,19 @@ class APILogger:
             log_path = Path(log_dir)
             log_path.mkdir(parents=True, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = log_path / f"api_tests_{timestamp}.log"
+            # One file per xdist worker so parallel workers never interleave writes
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+            log_file = log_path / f"api_tests_{timestamp}_{worker}.log"
             
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            # Opened on the first record; rotated so verbose DEBUG runs stay bounded
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=50_000_000,
+                backupCount=3,
+                encoding="utf-8",
+                delay=True
+            )
             file_handler.setLevel(logging.DEBUG)
             
             file_format = logging.Formatter(
@@ -73,7 +104,14 @@ class APILogger:
                 datefmt="%Y-%m-%d %H:%M:%S"
             )
             file_handler.setFormatter(file_format)
-            self.logger.addHandler(file_handler)
+            
+            # Disk writes happen on a listener thread, off the request path;
+            # console output stays synchronous so it keeps its place in pytest output
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            self._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self._listener.stop)
+            self.logger.addHandler(QueueHandler(log_queue))
             
             self.logger.info(f"Logging to file: {log_file}")
     
@@ -97,12 +135,24 @@ class APILogger:
         """Log critical message."""
         self.logger.critical(message, **kwargs)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Check whether messages at the given level would be emitted.
+        
+        Args:
+            level: Logging level (e.g. logging.DEBUG)
+            
+        Returns:
+            True if the logger handles the level
+        """
+        return self.logger.isEnabledFor(level)
+    
     def log_request(
         self,
         method: str,
         url: str,
-        headers: Optional[Dict[str, Any]] = None,
-        body: Optional[Dict[str, Any]] = None
+        headers: Optional[Mapping[str, Any]] = None,
+        body: Any = None
     ) -> None:
         """
         Log HTTP request details with sanitization.
@@ -113,21 +163,21 @@ class APILogger:
             headers: Request headers
             body: Request body
         """
-        sanitized_headers = self._sanitize_dict(headers) if headers else {}
-        sanitized_body = self._sanitize_dict(body) if body else {}
+        self.logger.info("→ REQUEST: %s %s", method, url)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         
-        self.logger.info(f"→ REQUEST: {method} {url}")
-        if sanitized_headers:
-            self.logger.debug(f"  Headers: {sanitized_headers}")
-        if sanitized_body:
-            self.logger.debug(f"  Body: {sanitized_body}")
+        if headers:
+            self.logger.debug("  Headers: %s", self._sanitize_dict(headers))
+        if body:
+            self.logger.debug("  Body: %s", self._sanitize_body(body))
     
     def log_response(
         self,
         status_code: int,
         response_time: float,
-        headers: Optional[Dict[str, Any]] = None,
-        body: Optional[Dict[str, Any]] = None
+        headers: Optional[Mapping[str, Any]] = None,
+        body: Any = None
     ) -> None:
         """
         Log HTTP response details.
@@ -138,58 +188,105 @@ class APILogger:
             headers: Response headers
             body: Response body
         """
-        color = self._get_status_color(status_code)
-        self.logger.info(f"← RESPONSE: {status_code} ({response_time:.3f}s)")
+        self.logger.info("← RESPONSE: %s (%.3fs)", status_code, response_time)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         
         if headers:
-            self.logger.debug(f"  Headers: {dict(headers)}")
+            self.logger.debug("  Headers: %s", headers)
         if body:
-            self.logger.debug(f"  Body: {body}")
+            self.logger.debug("  Body: %s", body)
     
     def log_test_start(self, test_name: str) -> None:
         """Log the start of a test."""
-        self.logger.info(f"{'='*80}")
-        self.logger.info(f"▶ Starting test: {test_name}")
-        self.logger.info(f"{'='*80}")
+        self.logger.info(f"{_SEP}\n▶ Starting test: {test_name}\n{_SEP}")
     
     def log_test_end(self, test_name: str, status: str = "PASSED") -> None:
         """Log the end of a test."""
         symbol = "✓" if status == "PASSED" else "✗"
-        self.logger.info(f"{symbol} Test {status}: {test_name}")
-        self.logger.info(f"{'='*80}\n")
+        self.logger.info(f"{symbol} Test {status}: {test_name}\n{_SEP}\n")
     
-    def _sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def write_bulk(self, events: Iterable[Tuple[str, int, str, str]]) -> None:
         """
-        Sanitize dictionary by masking sensitive values.
+        Log buffered test start/end events as a single record.
         
         Args:
-            data: Dictionary to sanitize
+            events: (event, monotonic_ns, test_name, status) tuples, where
+                event is "start" or "end"
+        """
+        lines: List[str] = []
+        started: Dict[str, int] = {}
+        for event, timestamp, test_name, status in events:
+            if event == "start":
+                started[test_name] = timestamp
+                lines += [_SEP, f"▶ Starting test: {test_name}", _SEP]
+            else:
+                symbol = "✓" if status == "PASSED" else "✗"
+                duration = (timestamp - started.pop(test_name, timestamp)) / 1e9
+                lines += [f"{symbol} Test {status}: {test_name} ({duration:.3f}s)", _SEP + "\n"]
+        
+        if lines:
+            self.logger.info("\n".join(lines))
+    
+    def _sanitize_dict(self, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Sanitize mapping by masking sensitive values.
+        
+        Args:
+            data: Mapping to sanitize
             
         Returns:
-            Sanitized dictionary
+            Sanitized copy, or data itself when no key is sensitive
         """
-        sensitive_keys = {"password", "token", "api_key", "secret", "authorization"}
-        sanitized = {}
+        if not any(map(_SENSITIVE_KEY_RE.search, data)):
+            return data
+        return {
+            key: "***REDACTED***" if _SENSITIVE_KEY_RE.search(key) else value
+            for key, value in data.items()
+        }
+    
+    def _sanitize_body(self, body: Any) -> Any:
+        """
+        Sanitize a request body.
         
-        for key, value in data.items():
-            if any(sensitive in key.lower() for sensitive in sensitive_keys):
-                sanitized[key] = "***REDACTED***"
-            else:
-                sanitized[key] = value
+        Pre-encoded JSON objects (bytes or str) are decoded and masked like
+        mappings. Any other raw body is logged as its size only, since form
+        strings and binary payloads may carry secrets that can't be masked.
         
-        return sanitized
-    
-    def _get_status_color(self, status_code: int) -> str:
-        """Get color based on HTTP status code."""
-        if 200 <= status_code < 300:
-            return "green"
-        elif 300 <= status_code < 400:
-            return "yellow"
-        elif 400 <= status_code < 500:
-            return "red"
-        else:
-            return "red"
+        Args:
+            body: Request body
+            
+        Returns:
+            Sanitized body, or a size placeholder
+        """
+        if isinstance(body, Mapping):
+            return self._sanitize_dict(body)
+        if isinstance(body, str):
+            body = body.encode()
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            try:
+                decoded = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                decoded = None
+            if isinstance(decoded, Mapping):
+                return self._sanitize_dict(decoded)
+            return f"<{len(body)} bytes>"
+        return f"<{type(body).__name__} body>"
+
+
+@lru_cache(maxsize=1)
+def get_logger() -> APILogger:
+    """
+    Get the memoized logger instance.
+    
+    Handlers are installed (and the log file opened) on first call only,
+    in settings.log_dir.
+    
+    Returns:
+        Shared APILogger instance
+    """
+    return APILogger(log_dir=settings.log_dir)
 
 
-# Global logger instance
-logger = APILogger()
+# Global logger instance, created on first attribute access
+logger: APILogger = LazyProxy(get_logger)  # type: ignore[assignment]
@@ -0,0 +1,121 @@
+"""
+In-process cache for idempotent GET responses.
+
+Lets repeated fixture data fetches against the read-only test API skip the network round-trip.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Tuple
+
+# (URL, sorted query parameters, sorted request headers)
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...], Tuple[Tuple[str, str], ...]]
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of API responses keyed on URL, query parameters and headers.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Initialize the response cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> CacheKey:
+        """
+        Build a cache key for a GET request.
+
+        Headers are part of the key so that, for example, responses fetched
+        with and without an Authorization header are cached separately.
+
+        Args:
+            url: Full request URL
+            params: URL parameters
+            headers: Request headers
+
+        Returns:
+            Hashable cache key
+        """
+        return (
+            url,
+            tuple(sorted(params.items())) if params else (),
+            tuple(sorted(headers.items())) if headers else (),
+        )
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get cached response and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response, or None on miss
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def set(self, key: CacheKey, response: Any) -> None:
+        """
+        Store response, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key from make_key
+            response: Response to cache
+        """
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> int:
+        """
+        Remove cached responses for a URL and every path below it.
+
+        Args:
+            url: URL prefix, e.g. a collection URL
+
+        Returns:
+            Number of evicted responses
+        """
+        subpath = url.rstrip("/") + "/"
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == url or key[0].startswith(subpath)]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global response cache instance
+response_cache = ResponseCache()
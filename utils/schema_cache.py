@@ -0,0 +1,62 @@
+"""
+Cache of compiled JSON Schema validators.
+
+Lets schema assertions compile each schema once per run instead of on every call.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+import fastjsonschema
+
+Validator = Callable[[Any], Any]
+
+_validators: Dict[int, Tuple[Dict[str, Any], Validator]] = {}
+_lock = threading.Lock()
+
+
+def _compile(schema: Dict[str, Any]) -> Validator:
+    """
+    Compile schema with fastjsonschema, falling back to jsonschema.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Callable raising on invalid data
+    """
+    validate: Validator
+    try:
+        validate = fastjsonschema.compile(schema)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        # jsonschema is slow to import, so load it only when needed
+        import jsonschema
+
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validate = validator_cls(schema).validate
+    return validate
+
+
+def get_validator(schema: Dict[str, Any]) -> Validator:
+    """
+    Get the compiled validator for a schema, compiling it on first use.
+
+    Validators are cached by schema identity; the schema itself is kept
+    alongside so its id cannot be reused by another dict.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Callable raising JsonSchemaValueException (jsonschema ValidationError
+        on fallback) on invalid data
+    """
+    entry = _validators.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    validator = _compile(schema)
+    with _lock:
+        _validators[id(schema)] = (schema, validator)
+    return validator
@@ -1,42 +1,113 @@
 """
-Test data generation utilities using Faker.
+Test data generation utilities using mimesis and Faker.
 
 Provides realistic test data for API testing scenarios.
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 
+import orjson
 from faker import Faker
+from mimesis import Person, Text
+from mimesis.locales import Locale
 
-# Initialize Faker with seed for reproducibility
+# Initialize generators with seed for reproducibility
+SEED = 12345
 fake = Faker()
-Faker.seed(12345)
+Faker.seed(SEED)
 
+# mimesis backs the hot providers (names, jobs, emails, colors); Faker the rest
+_person = Person(Locale.EN, seed=SEED)
+_text = Text(Locale.EN, seed=SEED)
 
-@dataclass
-class UserData:
-    """User data model for test data generation."""
-    name: str
-    job: str
-    email: Optional[str] = None
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
+# Reserved domains, so generated addresses never belong to real mailboxes
+_EMAIL_DOMAINS = ("example.com", "example.org", "example.net")
 
+# ReqRes.in specific valid login/registration credentials
+_VALID_CREDENTIALS: Mapping[str, str] = MappingProxyType({
+    "email": "eve.holt@reqres.in",
+    "password": "pistol"
+})
 
-@dataclass
-class AuthData:
-    """Authentication data model."""
-    email: str
-    password: str
+# Constant payloads, built once and shared by every caller
+_INVALID_JSON_PAYLOADS = (
+    "{invalid json}",
+    '{"name": "test"',  # Missing closing brace
+    '{"name": }',  # Missing value
+    "",  # Empty string
+    "null",
+    "true",
+    "123",
+    '{"name": undefined}',  # Invalid value
+)
 
+_INVALID_EMAILS = (
+    "invalid.email",
+    "@example.com",
+    "user@",
+    "user name@example.com",
+    "user@.com",
+    "",
+)
 
-@dataclass
-class ResourceData:
-    """Resource data model for test data generation."""
-    name: str
-    year: int
-    color: str
-    pantone_value: str
+_SQL_INJECTION_PAYLOADS = (
+    "' OR '1'='1",
+    "'; DROP TABLE users--",
+    "1' OR '1' = '1",
+    "admin'--",
+    "' OR 1=1--",
+)
+
+_XSS_PAYLOADS = (
+    "<script>alert('XSS')</script>",
+    "<img src=x onerror=alert('XSS')>",
+    "javascript:alert('XSS')",
+    "<svg onload=alert('XSS')>",
+)
+
+_SPECIAL_CHARACTERS = (
+    "!@#$%^&*()",
+    "日本語",  # Japanese
+    "Ñoño",  # Spanish with tildes
+    "Москва",  # Cyrillic
+    "🎉🎊🎁",  # Emojis
+    "\n\r\t",  # Whitespace characters
+    "\\x00\\x01\\x02",  # Null bytes
+)
+
+_BOUNDARY_VALUES: Mapping[str, Any] = MappingProxyType({
+    "empty_string": "",
+    "single_char": "A",
+    "very_long": "A" * 10000,
+    "zero": 0,
+    "negative": -1,
+    "max_int": 2147483647,
+    "min_int": -2147483648,
+    "null": None,
+    "boolean_true": True,
+    "boolean_false": False,
+})
+
+
+def _generate_user() -> Dict[str, str]:
+    """Generate one bulk user record from the shared mimesis Person provider."""
+    return {
+        "name": _person.full_name(),
+        "job": _person.occupation(),
+        "email": _person.email(domains=_EMAIL_DOMAINS)
+    }
+
+
+def _generate_resource() -> Dict[str, Any]:
+    """Generate one resource record, drawing numbers straight from Faker's RNG."""
+    rng = fake.random
+    return {
+        "name": _text.color(),
+        "year": fake.year(),
+        "color": f"#{rng.randint(1, 0xFFFFFF):06x}",
+        "pantone_value": f"{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+    }
 
 
 class TestDataGenerator:
@@ -54,11 +125,11 @@ class TestDataGenerator:
             Dictionary with user data
         """
         data = {
-            "name": fake.name(),
-            "job": fake.job()
+            "name": _person.full_name(),
+            "job": _person.occupation()
         }
         if include_email:
-            data["email"] = fake.email()
+            data["email"] = _person.email(domains=_EMAIL_DOMAINS)
         return data
     
     @staticmethod
@@ -70,15 +141,15 @@ class TestDataGenerator:
             Dictionary with full user data
         """
         return {
-            "email": fake.email(),
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
-            "name": fake.name(),
-            "job": fake.job()
+            "email": _person.email(domains=_EMAIL_DOMAINS),
+            "first_name": _person.first_name(),
+            "last_name": _person.last_name(),
+            "name": _person.full_name(),
+            "job": _person.occupation()
         }
     
     @staticmethod
-    def generate_auth_data(valid: bool = True) -> Dict[str, str]:
+    def generate_auth_data(valid: bool = True) -> Mapping[str, str]:
         """
         Generate authentication data.
         
@@ -86,22 +157,18 @@ class TestDataGenerator:
             valid: Whether to generate valid credentials
             
         Returns:
-            Dictionary with auth credentials
+            Mapping with auth credentials (shared and read-only when valid)
         """
         if valid:
-            # ReqRes.in specific valid credentials
-            return {
-                "email": "eve.holt@reqres.in",
-                "password": "pistol"
-            }
+            return _VALID_CREDENTIALS
         else:
             return {
-                "email": fake.email(),
+                "email": _person.email(domains=_EMAIL_DOMAINS),
                 "password": fake.password()
             }
     
     @staticmethod
-    def generate_register_data(valid: bool = True) -> Dict[str, str]:
+    def generate_register_data(valid: bool = True) -> Mapping[str, str]:
         """
         Generate registration data.
         
@@ -109,104 +176,89 @@ class TestDataGenerator:
             valid: Whether to generate valid registration data
             
         Returns:
-            Dictionary with registration data
+            Mapping with registration data (shared and read-only when valid)
         """
         if valid:
-            # ReqRes.in specific valid registration
-            return {
-                "email": "eve.holt@reqres.in",
-                "password": "pistol"
-            }
+            return _VALID_CREDENTIALS
         else:
-            data = {"email": fake.email()}
+            data = {"email": _person.email(domains=_EMAIL_DOMAINS)}
             # Optionally include invalid password
-            if fake.boolean():
-                data["password"] = fake.password(length=fake.random_int(1, 5))
+            if fake.random.random() < 0.5:
+                # Only lowercase is required, so lengths below 4 are valid
+                data["password"] = fake.password(
+                    length=fake.random.randint(1, 5),
+                    special_chars=False,
+                    digits=False,
+                    upper_case=False
+                )
             return data
     
     @staticmethod
-    def generate_resource_data() -> Dict[str, any]:
+    def generate_resource_data() -> Dict[str, Any]:
         """
         Generate resource data.
         
         Returns:
             Dictionary with resource data
         """
-        return {
-            "name": fake.color_name(),
-            "year": fake.year(),
-            "color": fake.hex_color(),
-            "pantone_value": f"{fake.random_int(10, 99)}-{fake.random_int(1000, 9999)}"
-        }
+        return _generate_resource()
     
     @staticmethod
-    def generate_invalid_json() -> List[str]:
+    def generate_bulk_resources(count: int = 10) -> List[Dict[str, Any]]:
+        """
+        Generate multiple resource records for bulk testing.
+        
+        Args:
+            count: Number of resources to generate
+            
+        Returns:
+            List of resource dictionaries
+        """
+        return [_generate_resource() for _ in range(count)]
+    
+    @staticmethod
+    def generate_invalid_json() -> Tuple[str, ...]:
         """
         Generate invalid JSON payloads for negative testing.
         
         Returns:
-            List of invalid JSON strings
+            Tuple of invalid JSON strings
         """
-        return [
-            "{invalid json}",
-            '{"name": "test"',  # Missing closing brace
-            '{"name": }',  # Missing value
-            "",  # Empty string
-            "null",
-            "true",
-            "123",
-            '{"name": undefined}',  # Invalid value
-        ]
+        return _INVALID_JSON_PAYLOADS
     
     @staticmethod
     def generate_invalid_email() -> str:
         """Generate invalid email address."""
-        invalid_formats = [
-            "invalid.email",
-            "@example.com",
-            "user@",
-            "user name@example.com",
-            "user@.com",
-            ""
-        ]
-        return fake.random_element(invalid_formats)
+        return fake.random.choice(_INVALID_EMAILS)
     
     @staticmethod
-    def generate_sql_injection_payloads() -> List[str]:
+    def generate_sql_injection_payloads() -> Tuple[str, ...]:
         """
         Generate SQL injection test payloads.
         
         Returns:
-            List of SQL injection strings
+            Tuple of SQL injection strings
         """
-        return [
-            "' OR '1'='1",
-            "'; DROP TABLE users--",
-            "1' OR '1' = '1",
-            "admin'--",
-            "' OR 1=1--",
-        ]
+        return _SQL_INJECTION_PAYLOADS
     
     @staticmethod
-    def generate_xss_payloads() -> List[str]:
+    def generate_xss_payloads() -> Tuple[str, ...]:
         """
         Generate XSS test payloads.
         
         Returns:
-            List of XSS strings
+            Tuple of XSS strings
         """
-        return [
-            "<script>alert('XSS')</script>",
-            "<img src=x onerror=alert('XSS')>",
-            "javascript:alert('XSS')",
-            "<svg onload=alert('XSS')>",
-        ]
+        return _XSS_PAYLOADS
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def generate_long_string(length: int = 10000) -> str:
         """
         Generate extremely long string for boundary testing.
         
+        Strings are immutable, so each length is built once and shared.
+        
         Args:
             length: String length
             
@@ -216,43 +268,24 @@ class TestDataGenerator:
         return "A" * length
     
     @staticmethod
-    def generate_special_characters() -> List[str]:
+    def generate_special_characters() -> Tuple[str, ...]:
         """
         Generate strings with special characters.
         
         Returns:
-            List of special character strings
+            Tuple of special character strings
         """
-        return [
-            "!@#$%^&*()",
-            "日本語",  # Japanese
-            "Ñoño",  # Spanish with tildes
-            "Москва",  # Cyrillic
-            "🎉🎊🎁",  # Emojis
-            "\n\r\t",  # Whitespace characters
-            "\\x00\\x01\\x02",  # Null bytes
-        ]
+        return _SPECIAL_CHARACTERS
     
     @staticmethod
-    def generate_boundary_values() -> Dict[str, any]:
+    def generate_boundary_values() -> Mapping[str, Any]:
         """
         Generate boundary values for testing.
         
         Returns:
-            Dictionary with boundary test values
+            Read-only mapping with boundary test values
         """
-        return {
-            "empty_string": "",
-            "single_char": "A",
-            "very_long": "A" * 10000,
-            "zero": 0,
-            "negative": -1,
-            "max_int": 2147483647,
-            "min_int": -2147483648,
-            "null": None,
-            "boolean_true": True,
-            "boolean_false": False,
-        }
+        return _BOUNDARY_VALUES
     
     @staticmethod
     def generate_bulk_users(count: int = 10) -> List[Dict[str, str]]:
@@ -265,14 +298,44 @@ class TestDataGenerator:
         Returns:
             List of user dictionaries
         """
-        return [
-            {
-                "name": fake.name(),
-                "job": fake.job(),
-                "email": fake.email()
+        return [_generate_user() for _ in range(count)]
+    
+    @staticmethod
+    def generate_bulk_users_json(count: int = 10) -> List[bytes]:
+        """
+        Generate multiple user records pre-serialized as JSON request bodies.
+        
+        Records are encoded as they are generated, so callers can send them as-is.
+        
+        Args:
+            count: Number of users to generate
+            
+        Returns:
+            List of JSON-encoded user objects
+        """
+        return [orjson.dumps(_generate_user()) for _ in range(count)]
+    
+    @staticmethod
+    def iter_bulk_users(count: int = 10) -> Iterator[Dict[str, str]]:
+        """
+        Lazily generate user records one at a time.
+        
+        Lets callers that stream records (to a file or over HTTP) overlap
+        generation with consumption without holding the whole batch.
+        
+        Args:
+            count: Number of users to generate
+            
+        Yields:
+            User dictionaries
+        """
+        full_name, occupation, email = _person.full_name, _person.occupation, _person.email
+        for _ in range(count):
+            yield {
+                "name": full_name(),
+                "job": occupation(),
+                "email": email(domains=_EMAIL_DOMAINS)
             }
-            for _ in range(count)
-        ]
 
 
 # Global instance